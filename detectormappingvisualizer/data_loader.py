@@ -1,12 +1,245 @@
 """Data loader and validator for detector aging analysis results."""
 
+import hashlib
 import json
 import logging
+import mmap
+import os
+import pickle
+import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    # Optional fast JSON parser; the stdlib json module is used otherwise
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+# Default for dict lookups where None is a legitimate (if invalid) value
+_MISSING = object()
+
+# Per-user directory for validated data cached by DataLoader.load_from_file
+_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "detectormappingvisualizer"
+)
+
+
+def _loads(buf: Union[bytes, str, memoryview]) -> Any:
+    """Parse a JSON document, using orjson when it is installed.
+
+    orjson rejects the NaN and Infinity literals that the stdlib json module
+    writes and accepts, so documents orjson cannot parse are parsed again
+    with json. Either way, a malformed document raises json.JSONDecodeError
+    (orjson.JSONDecodeError subclasses it).
+
+    Args:
+        buf: JSON document as bytes, str or a memoryview of the bytes
+
+    Returns:
+        Parsed JSON data
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(buf, memoryview):
+        return json.loads(buf.tobytes())
+    return json.loads(buf)
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert NumPy arrays and scalars for the JSON serializers.
+
+    Args:
+        obj: Object the serializer cannot handle natively
+
+    Returns:
+        Equivalent nested lists or Python scalar
+
+    Raises:
+        TypeError: If obj is not a NumPy array or scalar
+    """
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data as indented JSON, using orjson when it is installed.
+
+    NumPy arrays and scalars are accepted by either serializer. orjson
+    writes them natively, falling back to _json_default for what it cannot
+    (e.g. non-contiguous arrays); the stdlib json module always uses it.
+
+    orjson writes NaN and infinite floats as null, while json writes them
+    as NaN and Infinity literals. So that the file does not depend on which
+    package is installed, documents with a null from orjson are written
+    again with json; null is rare in these files, so this costs one byte
+    search on the usual path.
+
+    Args:
+        data: JSON-serializable data, which may contain NumPy values
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    if HAS_ORJSON:
+        buf = orjson.dumps(
+            data,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        )
+        if buf.find(b"null") == -1:
+            return buf
+    return json.dumps(data, indent=2, default=_json_default).encode("utf-8")
+
+
+# A document holding nothing but JSON whitespace
+_BLANK_DOCUMENT = re.compile(rb"[ \t\n\r]*")
+
+
+def _require_datasets_key(buf: Union[bytes, mmap.mmap]) -> None:
+    """Reject a raw JSON document that cannot contain a 'datasets' key.
+
+    Every valid document contains the literal '"datasets"', so a byte search
+    (a memchr-speed scan) rejects files with the wrong schema without paying
+    for a full parse. Empty and whitespace-only documents are let through so
+    that the parser reports them as a decode error.
+
+    Any other document without the key, including one that is not JSON at
+    all (such as a truncated or corrupted file), is reported with the schema
+    error "Data must contain 'datasets' key" rather than a JSON decode error.
+
+    Args:
+        buf: Raw JSON document
+
+    Raises:
+        DataValidationError: If the 'datasets' key does not appear in the document
+    """
+    if buf.find(b'"datasets"') == -1 and not _BLANK_DOCUMENT.fullmatch(buf):
+        raise DataValidationError("Data must contain 'datasets' key")
+
+
+def _load_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping it when orjson is available.
+
+    orjson parses straight from the mapped pages, so the file contents are
+    never copied into an intermediate bytes object. The stdlib parser cannot
+    read from a buffer and gets the file contents instead.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        DataValidationError: If the file cannot contain a 'datasets' key
+    """
+    if not HAS_ORJSON:
+        buf = path.read_bytes()
+        _require_datasets_key(buf)
+        return json.loads(buf)
+
+    with open(path, "rb") as f:
+        # Empty files cannot be mapped; let the parser raise the decode error
+        if os.fstat(f.fileno()).st_size == 0:
+            return orjson.loads(b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            _require_datasets_key(mm)
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+def _cache_path(path: Path, factor_types: Optional[FrozenSet[str]]) -> Path:
+    """Return the cache file for the current version of a data file.
+
+    The key covers the file's location, modification time and size, so an
+    edited file never hits a stale entry.
+
+    Args:
+        path: Path to the JSON file
+        factor_types: Factor types kept in the cached data, or None for all
+
+    Returns:
+        Path of the cache file (which may not exist yet)
+
+    Raises:
+        FileNotFoundError: If the data file doesn't exist
+    """
+    st = path.stat()
+    kept = ",".join(sorted(factor_types)) if factor_types is not None else "*"
+    key = f"{path.resolve()}\0{st.st_mtime_ns}\0{st.st_size}\0{kept}"
+    return _CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
+
+
+def _read_cache(cache_path: Path) -> Optional[Dict[str, Any]]:
+    """Load validated data from a cache file.
+
+    Args:
+        cache_path: Path of the cache file
+
+    Returns:
+        Cached data dictionary, or None if there is no usable cache entry
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            data: Dict[str, Any] = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {cache_path}: {e}")
+        return None
+    return data
+
+
+def _write_cache(cache_path: Path, data: Dict[str, Any]) -> None:
+    """Store validated data in a cache file.
+
+    The file is written under a temporary name and renamed into place, so a
+    concurrent reader never sees a partial entry. Failures are logged and
+    otherwise ignored; the cache is only an optimization.
+
+    Args:
+        cache_path: Path of the cache file
+        data: Validated data dictionary
+    """
+    try:
+        _CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except OSError as e:
+        logger.warning(f"Could not write cache file {cache_path}: {e}")
+
 
 class DataValidationError(Exception):
     """Raised when data validation fails."""
@@ -17,14 +250,23 @@ class DataValidationError(Exception):
 class DataLoader:
     """Load and validate detector aging analysis data from JSON files."""
 
-    REQUIRED_FIELDS = {
-        "dataset": ["date", "modules"],
-        "module": ["identifier", "channels"],
-        "channel": ["name", "ageing_factors"],
+    # Flat tuples iterated by the validators, saving a dict lookup per element
+    _DATASET_FIELDS: ClassVar[Tuple[str, ...]] = ("date", "modules")
+    _MODULE_FIELDS: ClassVar[Tuple[str, ...]] = ("identifier", "channels")
+    _CHANNEL_FIELDS: ClassVar[Tuple[str, ...]] = ("name", "ageing_factors")
+
+    REQUIRED_FIELDS: ClassVar[Dict[str, List[str]]] = {
+        "dataset": list(_DATASET_FIELDS),
+        "module": list(_MODULE_FIELDS),
+        "channel": list(_CHANNEL_FIELDS),
     }
 
+    # Exact value types accepted as a numeric ageing factor by the fast path;
+    # anything else (e.g. a float subclass) is left to the detailed validator
+    _NUMERIC_FACTOR_TYPES: ClassVar[FrozenSet[type]] = frozenset((int, float, bool))
+
     # This constant is only used for example data generation
-    AGEING_FACTOR_TYPES = [
+    AGEING_FACTOR_TYPES: ClassVar[List[str]] = [
         "normalized_gauss_ageing_factor",
         "normalized_weighted_ageing_factor",
         "gaussian_ageing_factor",
@@ -33,27 +275,48 @@ class DataLoader:
     ]
 
     @staticmethod
-    def load_from_file(file_path: str) -> Dict[str, Any]:
+    def load_from_file(
+        file_path: Union[str, Path],
+        factor_types: Optional[Iterable[str]] = None,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
         """Load and validate data from a JSON file.
 
         Args:
             file_path: Path to the JSON file
+            factor_types: Ageing factor types to keep. When given, every other
+                factor is dropped from the channels after validation, so the
+                returned data only holds the values the caller will read.
+            use_cache: Keep a pickled copy of the validated data in a per-user
+                cache directory. Later loads of the same, unmodified file
+                read that copy and skip parsing and validation.
 
         Returns:
             Validated data dictionary
 
         Raises:
             FileNotFoundError: If the file doesn't exist
-            json.JSONDecodeError: If the file is not valid JSON
-            DataValidationError: If the data structure is invalid
+            json.JSONDecodeError: If the file is not valid JSON, including an
+                empty or whitespace-only file
+            DataValidationError: If the data structure is invalid. This is also
+                raised before parsing when the document does not contain a
+                'datasets' key, even if it is not valid JSON.
         """
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        kept = frozenset(factor_types) if factor_types is not None else None
+        cache_path: Optional[Path] = None
 
+        # Let open() report a missing file rather than stat()ing it first
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if use_cache:
+                cache_path = _cache_path(path, kept)
+                cached = _read_cache(cache_path)
+                if cached is not None:
+                    logger.info(f"Loaded validated data for {file_path} from cache")
+                    return cached
+            data: Dict[str, Any] = _load_file(path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON from {file_path}: {e}")
             raise
@@ -61,9 +324,99 @@ class DataLoader:
         # Validate the loaded data
         DataLoader.validate_data(data)
 
+        if kept is not None:
+            DataLoader.select_factor_types(data, kept)
+
+        if cache_path is not None:
+            _write_cache(cache_path, data)
+
         logger.info(f"Successfully loaded and validated data from {file_path}")
         return data
 
+    @staticmethod
+    def load_directory(
+        dir_path: Union[str, Path],
+        workers: Optional[int] = None,
+        factor_types: Optional[Iterable[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Load and validate every JSON file in a directory in parallel.
+
+        Files are independent, so they are parsed and validated in a pool of
+        worker processes. Results are yielded in sorted file-name order.
+
+        Args:
+            dir_path: Directory containing the JSON files
+            workers: Number of worker processes (defaults to the CPU count)
+            factor_types: Ageing factor types to keep; see load_from_file.
+                Unused factors are dropped in the workers, before the results
+                are sent back to this process.
+
+        Yields:
+            Validated data dictionaries, one per file
+
+        Raises:
+            FileNotFoundError: If the directory doesn't exist
+            json.JSONDecodeError: If a file is not valid JSON
+            DataValidationError: If a file's data structure is invalid or it
+                has no 'datasets' key; see load_from_file
+        """
+        path = Path(dir_path)
+        if not path.is_dir():
+            raise FileNotFoundError(f"Directory not found: {dir_path}")
+
+        file_paths = [str(p) for p in sorted(path.glob("*.json"))]
+        if not file_paths:
+            logger.warning(f"No JSON files found in {dir_path}")
+            return
+
+        load = DataLoader.load_from_file
+        if factor_types is not None:
+            load = partial(load, factor_types=frozenset(factor_types))
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(load, file_paths, chunksize=4)
+
+    @staticmethod
+    def load_from_file_stream(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+        """Stream and validate datasets from a JSON file one at a time.
+
+        Unlike load_from_file, the whole document is never held in memory:
+        each entry of the top-level 'datasets' list is parsed, validated and
+        yielded before the next one is read, so peak memory is bounded by the
+        largest single dataset. Requires the optional ijson package.
+
+        Args:
+            file_path: Path to the JSON file
+
+        Yields:
+            Validated dataset dictionaries, in file order
+
+        Raises:
+            ImportError: If ijson is not installed
+            FileNotFoundError: If the file doesn't exist
+            ijson.JSONError: If the file is not valid JSON
+            DataValidationError: If a dataset is invalid or no datasets are found
+        """
+        try:
+            import ijson
+        except ImportError as e:
+            raise ImportError(
+                "ijson is required for streaming loads. Please install it: pip install ijson"
+            ) from e
+
+        count = 0
+        with open(file_path, "rb") as f:
+            for dataset in ijson.items(f, "datasets.item", use_float=True):
+                if DataLoader._check_datasets([dataset]) == 0:
+                    DataLoader._validate_dataset(dataset, count)
+                count += 1
+                yield dataset
+
+        if not count:
+            raise DataValidationError("Data must contain a non-empty 'datasets' list")
+
+        logger.info(f"Successfully streamed {count} datasets from {file_path}")
+
     @staticmethod
     def load_from_string(json_string: str) -> Dict[str, Any]:
         """Load and validate data from a JSON string.
@@ -79,7 +432,7 @@ class DataLoader:
             DataValidationError: If the data structure is invalid
         """
         try:
-            data = json.loads(json_string)
+            data: Dict[str, Any] = _loads(json_string)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON string: {e}")
             raise
@@ -90,6 +443,24 @@ class DataLoader:
         logger.info("Successfully loaded and validated data from string")
         return data
 
+    @staticmethod
+    def save_to_file(data: Dict[str, Any], file_path: Union[str, Path]) -> None:
+        """Save data to a JSON file with two-space indentation.
+
+        The document is serialized in one call and written as bytes, which is
+        much faster than json.dump's incremental writes when orjson is
+        installed.
+
+        Args:
+            data: Data dictionary to save. Ageing factors may be NumPy arrays
+                or scalars; they are written as plain JSON numbers.
+            file_path: Path to the output JSON file
+        """
+        with open(file_path, "wb") as f:
+            f.write(_dumps(data))
+
+        logger.info(f"Saved data to {file_path}")
+
     @staticmethod
     def validate_data(data: Dict[str, Any]) -> None:
         """Validate the structure and content of the data.
@@ -115,12 +486,83 @@ class DataLoader:
         if not datasets:
             raise DataValidationError("'datasets' list cannot be empty")
 
-        # Validate each dataset
-        for i, dataset in enumerate(datasets):
-            DataLoader._validate_dataset(dataset, i)
+        # Fast path: well-formed data is checked in a single pass. Only the
+        # datasets that need reporting go through the detailed validators,
+        # after which the fast path resumes with the next dataset.
+        i = DataLoader._check_datasets(datasets)
+        while i < len(datasets):
+            DataLoader._validate_dataset(datasets[i], i)
+            i = DataLoader._check_datasets(datasets, i + 1)
 
         logger.debug(f"Validated {len(datasets)} datasets successfully")
 
+    @staticmethod
+    def _check_datasets(datasets: List[Any], start: int = 0) -> int:
+        """Check the structure of the datasets in one pass.
+
+        All field names and type checks are inlined into a single function as
+        literals (kept in step with REQUIRED_FIELDS by the tests), so
+        well-formed data is validated without per-level call overhead, field
+        table lookups or error message formatting. Nothing is reported here:
+        the function stops at the first dataset with anything that needs an
+        error or a warning, and the caller then runs the detailed validators
+        on that dataset only.
+
+        Module identifiers and channel names are interned along the way, so the
+        strings repeated across datasets share a single object.
+
+        Args:
+            datasets: List of datasets to check
+            start: Index of the first dataset to check
+
+        Returns:
+            Index of the first dataset that needs detailed validation, or
+            len(datasets) if every remaining dataset is valid and needs no warnings
+        """
+        # Bind the per-channel callables to locals to skip global and
+        # attribute lookups in the innermost loop
+        is_non_numeric = DataLoader._NUMERIC_FACTOR_TYPES.isdisjoint
+        intern = sys.intern
+
+        for index in range(start, len(datasets)):
+            dataset = datasets[index]
+            if not isinstance(dataset, dict) or "date" not in dataset:
+                return index
+            modules = dataset.get("modules")
+            if not isinstance(dataset["date"], str) or not isinstance(modules, list) or not modules:
+                return index
+
+            for module in modules:
+                if not isinstance(module, dict) or (
+                    "identifier" not in module and "id" not in module
+                ):
+                    return index
+                identifier = module.get("identifier")
+                if type(identifier) is str:
+                    module["identifier"] = intern(identifier)
+                module_id = module.get("id")
+                if type(module_id) is str:
+                    module["id"] = intern(module_id)
+                channels = module.get("channels")
+                if not isinstance(channels, list) or not channels:
+                    return index
+
+                for channel in channels:
+                    if not isinstance(channel, dict):
+                        return index
+                    name = channel.get("name")
+                    if type(name) is not str:
+                        return index
+                    channel["name"] = intern(name)
+                    ageing_factors = channel.get("ageing_factors")
+                    # isdisjoint() stops at the first numeric value it sees
+                    if not isinstance(ageing_factors, dict) or is_non_numeric(
+                        map(type, ageing_factors.values())
+                    ):
+                        return index
+
+        return len(datasets)
+
     @staticmethod
     def _validate_dataset(dataset: Dict[str, Any], index: int) -> None:
         """Validate a single dataset.
@@ -136,7 +578,7 @@ class DataLoader:
             raise DataValidationError(f"Dataset at index {index} must be a dictionary")
 
         # Check required fields
-        for field in DataLoader.REQUIRED_FIELDS["dataset"]:
+        for field in DataLoader._DATASET_FIELDS:
             if field not in dataset:
                 raise DataValidationError(
                     f"Dataset at index {index} missing required field: '{field}'"
@@ -188,6 +630,8 @@ class DataLoader:
                 "'identifier' or 'id' field"
             )
 
+        DataLoader._intern_module_id(module)
+
         if "channels" not in module:
             raise DataValidationError(
                 f"Dataset {dataset_idx}, module {module_idx} missing 'channels' field"
@@ -211,6 +655,18 @@ class DataLoader:
         for k, channel in enumerate(channels):
             DataLoader._validate_channel(channel, dataset_idx, module_idx, k)
 
+    @staticmethod
+    def _intern_module_id(module: Dict[str, Any]) -> None:
+        """Intern the module identifier so repeated IDs share one string object.
+
+        Args:
+            module: Module dictionary, updated in place
+        """
+        for key in ("identifier", "id"):
+            module_id = module.get(key)
+            if type(module_id) is str:
+                module[key] = sys.intern(module_id)
+
     @staticmethod
     def _validate_channel(
         channel: Dict[str, Any],
@@ -235,23 +691,28 @@ class DataLoader:
                 f"channel {channel_idx} must be a dictionary"
             )
 
+        # Look each field up once; _MISSING tells absent fields from None values
+        name = channel.get("name", _MISSING)
+        ageing_factors = channel.get("ageing_factors", _MISSING)
+
         # Check required fields
-        for field in DataLoader.REQUIRED_FIELDS["channel"]:
-            if field not in channel:
-                raise DataValidationError(
-                    f"Dataset {dataset_idx}, module {module_idx}, "
-                    f"channel {channel_idx} missing required field: '{field}'"
-                )
+        if name is _MISSING or ageing_factors is _MISSING:
+            field = "name" if name is _MISSING else "ageing_factors"
+            raise DataValidationError(
+                f"Dataset {dataset_idx}, module {module_idx}, "
+                f"channel {channel_idx} missing required field: '{field}'"
+            )
 
         # Validate name field
-        if not isinstance(channel["name"], str):
+        if not isinstance(name, str):
             raise DataValidationError(
                 f"Dataset {dataset_idx}, module {module_idx}, "
                 f"channel {channel_idx}: 'name' must be a string"
             )
+        if type(name) is str:
+            channel["name"] = sys.intern(name)
 
         # Validate ageing_factors
-        ageing_factors = channel["ageing_factors"]
         if not isinstance(ageing_factors, dict):
             raise DataValidationError(
                 f"Dataset {dataset_idx}, module {module_idx}, "
@@ -259,11 +720,9 @@ class DataLoader:
             )
 
         # Check that at least one valid ageing factor exists (any key with numeric value)
-        has_valid_factor = False
-        for factor_type, factor_value in ageing_factors.items():
-            if isinstance(factor_value, (int, float)):
-                has_valid_factor = True
-                break
+        has_valid_factor = any(
+            isinstance(factor_value, (int, float)) for factor_value in ageing_factors.values()
+        )
 
         if not has_valid_factor:
             logger.warning(
@@ -271,6 +730,65 @@ class DataLoader:
                 f"channel {channel_idx}: no valid ageing factors found"
             )
 
+    @staticmethod
+    def select_factor_types(data: Dict[str, Any], factor_types: Iterable[str]) -> None:
+        """Drop every ageing factor not in factor_types, in place.
+
+        Analyses usually read a single factor type, so keeping only the
+        requested ones frees the other values early and makes the data much
+        cheaper to copy or send between processes. The data must already be
+        validated.
+
+        Args:
+            data: Validated data dictionary
+            factor_types: Ageing factor types to keep
+        """
+        keep = tuple(frozenset(factor_types))
+
+        for dataset in data["datasets"]:
+            for module in dataset["modules"]:
+                for channel in module["channels"]:
+                    ageing_factors = channel["ageing_factors"]
+                    channel["ageing_factors"] = {
+                        factor_type: ageing_factors[factor_type]
+                        for factor_type in keep
+                        if factor_type in ageing_factors
+                    }
+
+    @staticmethod
+    def extract_factor_array(data: Dict[str, Any], factor_type: str) -> np.ndarray:
+        """Extract one ageing factor type from every channel as a float64 array.
+
+        Channels are visited in dataset, module, channel order. Reductions and
+        outlier checks on the array run in NumPy rather than walking the
+        nested dicts in Python.
+
+        Args:
+            data: Validated data dictionary
+            factor_type: Ageing factor type to extract
+
+        Returns:
+            Contiguous float64 array with one value per channel; NaN where the
+            factor is missing or not numeric
+        """
+        nan = float("nan")
+        datasets = data["datasets"]
+        total_channels = sum(
+            len(module["channels"]) for dataset in datasets for module in dataset["modules"]
+        )
+        factors = (
+            channel["ageing_factors"].get(factor_type, nan)
+            for dataset in datasets
+            for module in dataset["modules"]
+            for channel in module["channels"]
+        )
+
+        return np.fromiter(
+            (factor if isinstance(factor, (int, float)) else nan for factor in factors),
+            dtype=np.float64,
+            count=total_channels,
+        )
+
     @staticmethod
     def get_summary(data: Dict[str, Any]) -> Dict[str, Any]:
         """Get a summary of the loaded data.
@@ -281,29 +799,71 @@ class DataLoader:
         Returns:
             Dictionary containing summary information
         """
-        summary = {
-            "total_datasets": len(data.get("datasets", [])),
-            "dates": [],
-            "modules_per_dataset": [],
-            "total_channels": 0,
-            "modules": set(),
+        # Flatten the modules once and tally everything from plain lists and
+        # sets; NumPy arrays would cost more than they save for a handful of
+        # counts
+        datasets = data.get("datasets", [])
+        module_lists = [dataset.get("modules", []) for dataset in datasets]
+        all_modules = [module for module_list in module_lists for module in module_list]
+
+        # Modules without an identifier are not counted
+        modules = sorted(
+            filter(None, {module.get("identifier", module.get("id")) for module in all_modules})
+        )
+
+        return {
+            "total_datasets": len(datasets),
+            "dates": [dataset.get("date") for dataset in datasets],
+            "modules_per_dataset": list(map(len, module_lists)),
+            "total_channels": sum(len(module.get("channels", [])) for module in all_modules),
+            "modules": modules,
+            "unique_modules": len(modules),
         }
 
-        for dataset in data.get("datasets", []):
-            summary["dates"].append(dataset.get("date"))
-            modules = dataset.get("modules", [])
-            summary["modules_per_dataset"].append(len(modules))
+    @staticmethod
+    def stream_summary(file_path: Union[str, Path]) -> Dict[str, Any]:
+        """Validate a JSON file and summarize it without loading it whole.
 
-            for module in modules:
-                module_id = module.get("identifier", module.get("id"))
-                if module_id:
-                    summary["modules"].add(module_id)
-                summary["total_channels"] += len(module.get("channels", []))
+        Datasets are streamed with load_from_file_stream and dropped once
+        counted, so memory use is bounded by the largest single dataset
+        rather than the whole document. Requires the optional ijson package.
 
-        summary["modules"] = sorted(list(summary["modules"]))
-        summary["unique_modules"] = len(summary["modules"])
+        Args:
+            file_path: Path to the JSON file
 
-        return summary
+        Returns:
+            Dictionary with the same summary information as get_summary
+
+        Raises:
+            ImportError: If ijson is not installed
+            FileNotFoundError: If the file doesn't exist
+            ijson.JSONError: If the file is not valid JSON
+            DataValidationError: If the data structure is invalid
+        """
+        dates: List[Optional[str]] = []
+        modules_per_dataset: List[int] = []
+        module_ids = set()
+        total_channels = 0
+
+        for dataset in DataLoader.load_from_file_stream(file_path):
+            modules = dataset["modules"]
+            dates.append(dataset["date"])
+            modules_per_dataset.append(len(modules))
+            for module in modules:
+                module_ids.add(module.get("identifier", module.get("id")))
+                total_channels += len(module["channels"])
+
+        # Modules without an identifier are not counted
+        modules_sorted = sorted(filter(None, module_ids))
+
+        return {
+            "total_datasets": len(dates),
+            "dates": dates,
+            "modules_per_dataset": modules_per_dataset,
+            "total_channels": total_channels,
+            "modules": modules_sorted,
+            "unique_modules": len(modules_sorted),
+        }
 
     @staticmethod
     def create_example_data(
@@ -323,12 +883,28 @@ class DataLoader:
         Returns:
             Example data dictionary
         """
-        import random
         from datetime import datetime, timedelta
 
         # Determine module prefix based on detector type
         module_prefix = "A" if detector_type == "fta" else "C"
 
+        # Generate realistic aging factors with some variation, drawing all
+        # channels of all datasets in a single vectorized call
+        rng = np.random.default_rng()
+        shape = (num_datasets, modules_per_dataset, channels_per_module)
+        trend = 1.0 - np.arange(num_datasets).reshape(-1, 1, 1) * 0.05
+        base_factors = np.clip(trend + rng.uniform(-0.1, 0.1, size=shape), 0.5, 1.2)
+
+        # Convert to nested lists of Python floats once, up front
+        gauss = np.round(base_factors, 3).tolist()
+        norm_weighted = np.round(base_factors * 0.98, 3).tolist()
+        gaussian = np.round(base_factors * 1.1, 3).tolist()
+        weighted = np.round(base_factors * 1.05, 3).tolist()
+
+        # Names are the same in every module and dataset, so build them once
+        channel_names = [f"CH{k + 1:02d}" for k in range(channels_per_module)]
+        module_ids = [f"{module_prefix}{j}" for j in range(modules_per_dataset)]
+
         datasets = []
         base_date = datetime(2024, 1, 1)
 
@@ -336,33 +912,26 @@ class DataLoader:
             date = (base_date + timedelta(days=i * 30)).strftime("%Y-%m-%d")
             modules = []
 
-            for j in range(modules_per_dataset):
-                module_id = f"{module_prefix}{j}"
-                channels = []
-
-                for k in range(1, channels_per_module + 1):
-                    channel_name = f"CH{k:02d}"
-
-                    # Generate realistic aging factors with some variation
-                    base_factor = 1.0 - (i * 0.05) + random.uniform(-0.1, 0.1)
-                    base_factor = max(0.5, min(1.2, base_factor))
-
-                    channels.append(
-                        {
-                            "name": channel_name,
-                            "ageing_factors": {
-                                "normalized_gauss_ageing_factor": round(
-                                    base_factor, 3
-                                ),
-                                "normalized_weighted_ageing_factor": round(
-                                    base_factor * 0.98, 3
-                                ),
-                                "gaussian_ageing_factor": round(base_factor * 1.1, 3),
-                                "weighted_ageing_factor": round(base_factor * 1.05, 3),
-                                "ageing_factor": round(base_factor, 3),
-                            },
-                        }
+            for j, module_id in enumerate(module_ids):
+                channels = [
+                    {
+                        "name": name,
+                        "ageing_factors": {
+                            "normalized_gauss_ageing_factor": g,
+                            "normalized_weighted_ageing_factor": nw,
+                            "gaussian_ageing_factor": ga,
+                            "weighted_ageing_factor": w,
+                            "ageing_factor": g,
+                        },
+                    }
+                    for name, g, nw, ga, w in zip(
+                        channel_names,
+                        gauss[i][j],
+                        norm_weighted[i][j],
+                        gaussian[i][j],
+                        weighted[i][j],
                     )
+                ]
 
                 modules.append({"identifier": module_id, "channels": channels})
 
@@ -1,17 +1,34 @@
 """Grid Visualization Service for Detector Mapping Visualization."""
 
 import csv
-import io
+import functools
 import logging
+import os
 import re
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-
-import matplotlib.pyplot as plt
+from typing import Any, BinaryIO, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import matplotlib
+import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import PolyCollection
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import Colormap, ListedColormap, Normalize
 from matplotlib.figure import Figure
+from matplotlib.text import Text
 
 logger = logging.getLogger(__name__)
 
+# Channel number in an upper-cased channel name (e.g. 'CH1', 'CH01', 'C12')
+_CH_RE = re.compile(r"CH?(\d+)")
+
+# Bumped whenever the layout of the .npz mapping sidecar files changes
+_MAPPING_CACHE_VERSION = 1
+
 
 def format_parameter_name(param_key: str) -> str:
     """Format a parameter key into a readable display name.
@@ -27,9 +44,13 @@ def format_parameter_name(param_key: str) -> str:
     return param_key.replace("_", " ").title()
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_pm_channel(pm: str, channel: str) -> str:
     """Normalize PM and channel names for consistent matching.
 
+    Results are cached: a mapping only has a few hundred distinct keys, and
+    the same keys are normalized again for every visualization and GIF frame.
+
     Args:
         pm: PM identifier (e.g., 'A6', 'PMA6', 'a6', 'C1', 'PMC1')
         channel: Channel name (e.g., 'CH1', 'CH01', 'Ch01', 'ch1')
@@ -37,6 +58,16 @@ def normalize_pm_channel(pm: str, channel: str) -> str:
     Returns:
         Normalized PM:Channel string (e.g., 'A6:CH01', 'C1:CH01')
     """
+    # Fast path: most inputs are already in 'A6', 'CH01' form and need no work
+    if (
+        pm.isupper()
+        and not pm.startswith("PM")
+        and len(channel) == 4
+        and channel.startswith("CH")
+        and channel[2:].isdecimal()
+    ):
+        return sys.intern(f"{pm}:{channel}")
+
     # Normalize PM: remove 'PM' prefix if present, convert to uppercase
     pm_normalized = pm.upper()
     if pm_normalized.startswith("PM"):
@@ -47,29 +78,146 @@ def normalize_pm_channel(pm: str, channel: str) -> str:
 
     # Extract channel number and ensure it has leading zero if needed
     # Handle various formats: CH1, CH01, Ch1, ch01, etc.
-    channel_match = re.search(r"CH?(\d+)", channel_normalized, re.IGNORECASE)
+    # If there is no match, the upper-cased original is used
+    channel_match = _CH_RE.search(channel_normalized)
     if channel_match:
         channel_num = channel_match.group(1)
         # Ensure 2-digit format with leading zero if needed
         channel_num = channel_num.zfill(2)
         channel_normalized = f"CH{channel_num}"
-    else:
-        # If no match, just use the original in uppercase
-        channel_normalized = channel_normalized
 
-    return f"{pm_normalized}:{channel_normalized}"
+    return sys.intern(f"{pm_normalized}:{channel_normalized}")
+
+
+def _cell_vertices(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Return the corners of the unit square centred on each grid position.
+
+    Args:
+        rows: Row (y) position of each cell
+        cols: Column (x) position of each cell
+
+    Returns:
+        Array of shape (N, 4, 2) with the (x, y) corners of each cell
+    """
+    offsets = np.array([[-0.5, -0.5], [0.5, -0.5], [0.5, 0.5], [-0.5, 0.5]])
+    return np.stack((cols, rows), axis=-1)[:, np.newaxis, :] + offsets
+
+
+class ResultsSummary(NamedTuple):
+    """Dates in the results data and the ageing factors for each of them."""
+
+    dates: List[str]
+    factors: Dict[str, Dict[str, float]]
+
+
+class _GridFigureState(NamedTuple):
+    """Artists and color scaling of a grid figure that change between dates."""
+
+    ax: Axes
+    cells: PolyCollection
+    texts: List[Text]
+    keys: List[str]
+    cmap: Colormap
+    vmin: float
+    vmax: float
+
+
+def _render_frames(
+    mapping_info: Dict[str, Any],
+    jobs: List[Tuple[str, Dict[str, float], str]],
+    colormap: Union[str, Colormap],
+    vmin: float,
+    vmax: float,
+    ageing_factor_type: str,
+    custom_colormap_colors: Optional[List[str]] = None,
+    dpi: float = 100,
+    max_width: Optional[int] = None,
+) -> List[Optional[np.ndarray]]:
+    """Render a run of GIF frames as RGB pixel arrays.
+
+    The figure is built once and updated for each frame. This is a
+    module-level function so it can run in a worker process; every argument
+    is picklable.
+
+    Args:
+        mapping_info: Mapping data as returned by get_mapping
+        jobs: (date, ageing factors, title) for each frame
+        colormap: Matplotlib colormap name, 'custom' or a resolved Colormap
+        vmin: Minimum value for color scaling
+        vmax: Maximum value for color scaling
+        ageing_factor_type: Type of ageing factor being displayed
+        custom_colormap_colors: List of colors when colormap='custom'
+        dpi: Resolution of the frames in dots per inch
+        max_width: Maximum frame width in pixels; the resolution is lowered
+            below dpi if needed to fit
+
+    Returns:
+        (height, width, 3) uint8 array for each frame, or None for frames that
+        failed to render
+    """
+    fig, state = GridVisualizationService._build_grid_figure(
+        mapping_info,
+        colormap,
+        vmin,
+        vmax,
+        ageing_factor_type,
+        custom_colormap_colors,
+        for_gif=True,
+    )
+    # Rendering at the final size is cheaper than downscaling afterwards and
+    # keeps the value labels legible
+    if max_width:
+        dpi = min(dpi, max_width / fig.get_figwidth())
+    fig.set_dpi(dpi)
+    canvas = FigureCanvasAgg(fig)
+
+    # Only the cells, value labels and title change between dates. Draw the
+    # rest of the figure (axes, colorbar) once, then restore it for each
+    # frame and draw just the changing artists over it. The GIF layout is
+    # fixed, so the saved background stays valid for every frame.
+    animated: List[Any] = []
+    background = None
+    if state is not None:
+        animated = [state.cells, *state.texts, state.ax.title]
+        for artist in animated:
+            artist.set_animated(True)
+        canvas.draw()
+        background = canvas.copy_from_bbox(fig.bbox)
+
+    rendered: List[Optional[np.ndarray]] = []
+    for date, ageing_factors, title in jobs:
+        try:
+            if state is None:
+                canvas.draw()
+            else:
+                GridVisualizationService._update_grid_figure(state, ageing_factors, title)
+                canvas.restore_region(background)
+                for artist in animated:
+                    fig.draw_artist(artist)
+
+            # Read the pixels straight from the Agg framebuffer instead of
+            # encoding and decoding a PNG; the copy drops the alpha channel
+            rendered.append(np.array(np.asarray(canvas.buffer_rgba())[..., :3]))
+        except Exception as e:
+            logger.error(f"Failed to render frame for date {date}: {e}")
+            rendered.append(None)
+
+    return rendered
 
 
 class GridVisualizationService:
     """Service for handling grid visualizations of detector mapping results."""
 
-    def __init__(self, mappings_dir: Optional[str] = None):
+    def __init__(self, mappings_dir: Optional[str] = None, cache_mappings: bool = False):
         """Initialize the GridVisualizationService.
 
         Args:
             mappings_dir: Directory containing mapping CSV files. If not provided,
                 uses the package's built-in grid_visualization_mappings directory.
+            cache_mappings: Keep the parsed form of each mapping in a .npz file
+                next to its CSV and load that instead while the CSV is unchanged
         """
+        self.cache_mappings = cache_mappings
         if mappings_dir:
             self.mappings_dir = Path(mappings_dir)
         else:
@@ -86,7 +234,15 @@ class GridVisualizationService:
             logger.warning(f"Mappings directory {self.mappings_dir} does not exist")
             return
 
-        for csv_file in self.mappings_dir.glob("*.csv"):
+        # One directory scan; the entries already know whether they are files
+        with os.scandir(self.mappings_dir) as entries:
+            csv_files = [
+                Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(".csv") and entry.is_file()
+            ]
+
+        for csv_file in csv_files:
             try:
                 mapping_info = self._load_mapping_file_from_path(csv_file)
                 if mapping_info:
@@ -113,15 +269,35 @@ class GridVisualizationService:
         mapping = {}
         channel_count = 0
 
+        if self.cache_mappings:
+            cached = self._read_mapping_cache(file_path)
+            if cached is not None:
+                return cached
+
         try:
-            with open(file_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
+            # Taken before parsing, so a CSV edited meanwhile is not cached as current
+            csv_stat = file_path.stat()
+
+            with open(file_path, encoding="utf-8", newline="") as f:
+                # Plain rows indexed by header position; no dict per row
+                reader = csv.reader(f)
+                header = next(reader, [])
+                key_idx = header.index("PM:Channel")
+                row_idx = header.index("row")
+                col_idx = header.index("col")
+                min_len = max(key_idx, row_idx, col_idx) + 1
+
                 for row in reader:
-                    pm_channel = row.get("PM:Channel", "").strip()
+                    if not row:
+                        continue
+                    if len(row) < min_len:
+                        logger.warning(f"Skipping short row in {file_path}: {row}")
+                        continue
+                    pm_channel = row[key_idx].strip()
                     if pm_channel:
                         try:
-                            row_pos = float(row.get("row", 0))
-                            col_pos = float(row.get("col", 0))
+                            row_pos = float(row[row_idx])
+                            col_pos = float(row[col_idx])
 
                             # Split PM:Channel and normalize
                             if ":" in pm_channel:
@@ -138,16 +314,130 @@ class GridVisualizationService:
                                 f"Invalid position values in {file_path}: {e}"
                             )
 
-            return {
-                "mapping": mapping,
-                "channel_count": channel_count,
-                "file_path": str(file_path),
-                "name": file_path.stem,
-            }
+            positions = np.array(list(mapping.values()), dtype=np.float64).reshape(-1, 2)
+            mapping_info = self._make_mapping_info(
+                file_path, list(mapping), positions[:, 0], positions[:, 1], channel_count
+            )
         except Exception as e:
             logger.error(f"Error loading mapping file {file_path}: {e}")
             return None
 
+        if self.cache_mappings:
+            self._write_mapping_cache(file_path, csv_stat, mapping_info)
+
+        return mapping_info
+
+    @staticmethod
+    def _read_mapping_cache(file_path: Path) -> Optional[Dict]:
+        """Load a mapping from its .npz sidecar if it matches the CSV.
+
+        Args:
+            file_path: Path to the CSV mapping file
+
+        Returns:
+            Dictionary containing mapping data and metadata, or None if there
+            is no sidecar or it is out of date
+        """
+        npz_path = file_path.with_suffix(".npz")
+        try:
+            csv_stat = file_path.stat()
+            with np.load(npz_path, allow_pickle=False) as npz:
+                if (
+                    int(npz["version"]) != _MAPPING_CACHE_VERSION
+                    or int(npz["mtime_ns"]) != csv_stat.st_mtime_ns
+                    or int(npz["size"]) != csv_stat.st_size
+                ):
+                    return None
+                keys = [sys.intern(key) for key in npz["keys"].tolist()]
+                rows = npz["rows"]
+                cols = npz["cols"]
+                channel_count = int(npz["channel_count"])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable mapping cache {npz_path}: {e}")
+            return None
+
+        return GridVisualizationService._make_mapping_info(
+            file_path, keys, rows, cols, channel_count
+        )
+
+    @staticmethod
+    def _make_mapping_info(
+        file_path: Path,
+        keys: List[str],
+        rows: np.ndarray,
+        cols: np.ndarray,
+        channel_count: int,
+    ) -> Dict[str, Any]:
+        """Assemble the mapping data returned by get_mapping.
+
+        The mapping is stored as parallel arrays: the normalized keys in file
+        order, with the row and column of each cell at the same index, and
+        key_to_idx to find a key's index. Positions stay float64 because the
+        mapping files place cells at fractional positions. The 'mapping'
+        dictionary is derived from the arrays for callers that look up
+        positions by key.
+
+        Args:
+            file_path: Path to the CSV mapping file
+            keys: Normalized PM:Channel keys, one per cell
+            rows: Row (y) position of each cell
+            cols: Column (x) position of each cell
+            channel_count: Number of channel rows read from the file
+
+        Returns:
+            Dictionary containing mapping data and metadata
+        """
+        return {
+            "mapping": dict(zip(keys, zip(rows.tolist(), cols.tolist()))),
+            "keys": keys,
+            "key_to_idx": {key: i for i, key in enumerate(keys)},
+            "rows": rows,
+            "cols": cols,
+            "channel_count": channel_count,
+            "file_path": str(file_path),
+            "name": file_path.stem,
+        }
+
+    @staticmethod
+    def _write_mapping_cache(
+        file_path: Path, csv_stat: os.stat_result, mapping_info: Dict[str, Any]
+    ) -> None:
+        """Store a parsed mapping in a .npz sidecar next to its CSV.
+
+        The sidecar is written under a temporary name and renamed into place.
+        Failures (e.g. a read-only install) are logged and otherwise ignored.
+
+        Args:
+            file_path: Path to the CSV mapping file
+            csv_stat: Result of stat() on the CSV, taken before it was parsed
+            mapping_info: Parsed mapping data
+        """
+        npz_path = file_path.with_suffix(".npz")
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=file_path.parent, suffix=".npz.tmp", delete=False
+            ) as f:
+                try:
+                    # Uncompressed: the files are small and load speed matters more
+                    np.savez(
+                        f,
+                        version=_MAPPING_CACHE_VERSION,
+                        mtime_ns=csv_stat.st_mtime_ns,
+                        size=csv_stat.st_size,
+                        keys=np.array(mapping_info["keys"], dtype=str),
+                        rows=mapping_info["rows"],
+                        cols=mapping_info["cols"],
+                        channel_count=mapping_info["channel_count"],
+                    )
+                except BaseException:
+                    os.unlink(f.name)
+                    raise
+            os.replace(f.name, npz_path)
+        except OSError as e:
+            logger.debug(f"Could not write mapping cache {npz_path}: {e}")
+
     def get_available_mappings(self) -> List[Dict]:
         """Get list of available mappings with metadata.
 
@@ -215,7 +505,7 @@ class GridVisualizationService:
 
             # Create the visualization
             fig = self._create_grid_figure(
-                mapping_info["mapping"],
+                mapping_info,
                 ageing_factors,
                 colormap,
                 vmin,
@@ -314,20 +604,109 @@ class GridVisualizationService:
             return factors
 
         # Extract ageing factors from the target dataset
-        for module in target_dataset.get("modules", []):
+        factors = self._extract_dataset_factors(target_dataset, ageing_factor_type, {})
+
+        logger.info(
+            f"Extracted {len(factors)} {ageing_factor_type} factors for date: "
+            f"{target_dataset.get('date')}"
+        )
+        return factors
+
+    def summarize(
+        self,
+        results_data: Dict,
+        ageing_factor_type: str = "normalized_gauss_ageing_factor",
+    ) -> ResultsSummary:
+        """Collect the dates and the ageing factors for each date in one pass.
+
+        The PM:Channel keys are the same for every date, so each one is
+        normalized once and reused for all datasets.
+
+        Args:
+            results_data: Analysis results data
+            ageing_factor_type: Type of ageing factor to extract
+
+        Returns:
+            ResultsSummary whose dates are those of get_available_dates and
+            whose factors map each date to its PM:Channel to ageing factor
+            dictionary. If several datasets share a date, the first one is used.
+        """
+        dates: List[str] = []
+        all_factors: Dict[str, Dict[str, float]] = {}
+        norm_cache: Dict[Tuple[Any, Any], str] = {}
+
+        for dataset in results_data.get("datasets", []):
+            date = dataset.get("date")
+            if date:
+                dates.append(date)
+                if date not in all_factors:
+                    all_factors[date] = self._extract_dataset_factors(
+                        dataset, ageing_factor_type, norm_cache
+                    )
+
+        logger.info(f"Extracted {ageing_factor_type} factors for {len(all_factors)} dates")
+        return ResultsSummary(sorted(dates), all_factors)
+
+    def _extract_all_ageing_factors(
+        self,
+        results_data: Dict,
+        ageing_factor_type: str = "normalized_gauss_ageing_factor",
+    ) -> Dict[str, Dict[str, float]]:
+        """Extract ageing factors for every date in one pass over the results.
+
+        Args:
+            results_data: Analysis results data
+            ageing_factor_type: Type of ageing factor to extract
+
+        Returns:
+            Dictionary mapping each date to its PM:Channel to ageing factor
+            dictionary. If several datasets share a date, the first one is used.
+        """
+        return self.summarize(results_data, ageing_factor_type).factors
+
+    @staticmethod
+    def _extract_dataset_factors(
+        dataset: Dict,
+        ageing_factor_type: str,
+        norm_cache: Dict[Tuple[Any, Any], str],
+    ) -> Dict[str, float]:
+        """Extract ageing factors from a single dataset.
+
+        Args:
+            dataset: Dataset dictionary
+            ageing_factor_type: Type of ageing factor to extract
+            norm_cache: Normalized PM:Channel key for each (module ID, channel
+                name) pair; filled in as new pairs are seen
+
+        Returns:
+            Dictionary mapping PM:Channel to ageing factor
+        """
+        factors: Dict[str, float] = {}
+
+        # Hoisted out of the per-channel loop
+        debug = logger.isEnabledFor(logging.DEBUG)
+        normalize = normalize_pm_channel
+
+        for module in dataset.get("modules", []):
             module_id = module.get("identifier", module.get("id", "unknown"))
 
             for channel in module.get("channels", []):
                 channel_name = channel.get("name", "unknown")
 
                 # Normalize the PM:Channel key for consistent matching
-                normalized_key = normalize_pm_channel(module_id, channel_name)
+                normalized_key = norm_cache.get((module_id, channel_name))
+                if normalized_key is None:
+                    normalized_key = normalize(module_id, channel_name)
+                    norm_cache[(module_id, channel_name)] = normalized_key
 
-                # Extract the ageing factor
+                # Extract the ageing factor; parsed JSON numbers are nearly
+                # always floats, which need no conversion
                 ageing_factors = channel.get("ageing_factors", {})
                 if isinstance(ageing_factors, dict):
                     factor = ageing_factors.get(ageing_factor_type)
-                    if factor is not None and not isinstance(factor, str):
+                    if type(factor) is float:
+                        factors[normalized_key] = factor
+                    elif factor is not None and not isinstance(factor, str):
                         try:
                             factors[normalized_key] = float(factor)
                         except (ValueError, TypeError):
@@ -336,18 +715,15 @@ class GridVisualizationService:
                             )
                             factors[normalized_key] = 1.0  # Default value
                     else:
-                        logger.debug(f"No valid ageing factor for {normalized_key}")
+                        if debug:
+                            logger.debug(f"No valid ageing factor for {normalized_key}")
                         factors[normalized_key] = 1.0  # Default value
 
-        logger.info(
-            f"Extracted {len(factors)} {ageing_factor_type} factors for date: "
-            f"{target_dataset.get('date')}"
-        )
         return factors
 
     def _create_grid_figure(
         self,
-        mapping: Dict[str, Tuple[float, float]],
+        mapping_info: Dict[str, Any],
         ageing_factors: Dict[str, float],
         colormap: str,
         vmin: float,
@@ -361,7 +737,7 @@ class GridVisualizationService:
         """Create the actual grid visualization figure.
 
         Args:
-            mapping: Dictionary mapping PM:Channel to (row, col) positions
+            mapping_info: Mapping data as returned by get_mapping
             ageing_factors: Dictionary mapping PM:Channel to ageing factor values
             colormap: Matplotlib colormap name or 'custom'
             vmin: Minimum value for color scaling
@@ -375,32 +751,88 @@ class GridVisualizationService:
         Returns:
             Matplotlib Figure with the grid visualization
         """
-        fig = Figure(figsize=(12, 10), dpi=100)
-        ax = fig.add_subplot(111)
+        fig, state = self._build_grid_figure(
+            mapping_info, colormap, vmin, vmax, ageing_factor_type, custom_colormap_colors
+        )
+        if state is None:
+            return fig
 
-        # Create the colormap
+        title = self._grid_title(mapping_name, ageing_factor_type, selected_date, results_data)
+        self._update_grid_figure(state, ageing_factors, title)
+
+        # Adjust layout
+        fig.tight_layout()
+
+        return fig
+
+    @staticmethod
+    def _resolve_colormap(
+        colormap: Union[str, Colormap], custom_colormap_colors: Optional[List[str]] = None
+    ) -> Colormap:
+        """Resolve a colormap name to a Colormap.
+
+        Args:
+            colormap: Matplotlib colormap name, 'custom' or an already resolved
+                Colormap, which is returned unchanged
+            custom_colormap_colors: List of colors when colormap='custom'
+
+        Returns:
+            The colormap
+
+        Raises:
+            KeyError: If the colormap name is not known to Matplotlib
+        """
+        if isinstance(colormap, Colormap):
+            return colormap
         if colormap == "custom" and custom_colormap_colors:
-            from matplotlib.colors import ListedColormap
+            return ListedColormap(custom_colormap_colors)
+        return matplotlib.colormaps[colormap]
 
-            cmap = ListedColormap(custom_colormap_colors)
-        else:
-            cmap = plt.get_cmap(colormap)
+    @staticmethod
+    def _build_grid_figure(
+        mapping_info: Dict[str, Any],
+        colormap: Union[str, Colormap],
+        vmin: float,
+        vmax: float,
+        ageing_factor_type: str = "normalized_gauss_ageing_factor",
+        custom_colormap_colors: Optional[List[str]] = None,
+        for_gif: bool = False,
+    ) -> Tuple[Figure, Optional[_GridFigureState]]:
+        """Build the parts of a grid figure that are the same for every date.
+
+        The cells, value labels and colorbar are created here without any
+        data; _update_grid_figure then fills in the values for one date. A GIF
+        builds the figure once and only updates it per frame.
+
+        Figures are created without pyplot, so building one never touches the
+        global backend (the GUI uses TkAgg) and needs no explicit close.
+
+        Args:
+            mapping_info: Mapping data as returned by get_mapping
+            colormap: Matplotlib colormap name, 'custom' or a resolved Colormap
+            vmin: Minimum value for color scaling
+            vmax: Maximum value for color scaling
+            ageing_factor_type: Type of ageing factor being displayed
+            custom_colormap_colors: List of colors when colormap='custom'
+            for_gif: Use a fixed layout with room for a two-line title, so no
+                layout pass is needed and every frame has the same geometry.
+                Otherwise the caller is expected to lay the figure out.
 
-        # Collect data points
-        x_positions = []
-        y_positions = []
-        values = []
-        labels = []
+        Returns:
+            Tuple of the figure and its per-frame state, or None instead of the
+            state if the mapping has no channels
+        """
+        fig = Figure(figsize=(12, 10), dpi=100)
+        ax = fig.add_subplot(111)
 
-        for pm_channel, (row, col) in mapping.items():
-            value = ageing_factors.get(pm_channel, 1.0)  # Default to 1.0 if no data
+        # Create the colormap
+        cmap = GridVisualizationService._resolve_colormap(colormap, custom_colormap_colors)
 
-            x_positions.append(col)
-            y_positions.append(row)
-            values.append(value)
-            labels.append(pm_channel)
+        keys = mapping_info["keys"]
+        x_positions = mapping_info["cols"]
+        y_positions = mapping_info["rows"]
 
-        if not values:
+        if not keys:
             ax.text(
                 0.5,
                 0.5,
@@ -413,57 +845,26 @@ class GridVisualizationService:
             ax.set_xticks([])
             ax.set_yticks([])
             ax.set_frame_on(False)
-            return fig
-
-        # Create squares for each position
-        for x, y, value in zip(x_positions, y_positions, values):
-            # Normalize value for color mapping
-            value_normalized = max(0, min(1, (value - vmin) / (vmax - vmin)))
-            rect = plt.Rectangle(
-                (x - 0.5, y - 0.5),
-                1,
-                1,
-                facecolor=cmap(value_normalized),
-                edgecolor="black",
-                linewidth=1,
-            )
-            ax.add_patch(rect)
-
-        # Add values inside each square
-        for x, y, value in zip(x_positions, y_positions, values):
-            text = f"{value:.2f}"
-            value_normalized = (value - vmin) / (vmax - vmin)
-            text_color = "black" if 0.3 < value_normalized < 0.7 else "white"
-            ax.text(x, y, text, ha="center", va="center", color=text_color, fontsize=8)
-
-        # Get reference date (first dataset is typically the reference)
-        reference_date = None
-        if results_data and results_data.get("datasets"):
-            reference_date = results_data["datasets"][0].get("date")
+            return fig, None
 
-        # Format the ageing factor type for display
-        display_name = format_parameter_name(ageing_factor_type)
-
-        # Main title with date comparison
-        if selected_date and reference_date and reference_date != selected_date:
-            title = (
-                f"{display_name} - {mapping_name.upper()}\n"
-                f"{selected_date} vs {reference_date}"
-            )
-        elif selected_date:
-            title = f"{display_name} - {mapping_name.upper()}\n{selected_date}"
-        else:
-            title = f"{display_name} - {mapping_name.upper()}"
+        # Draw all squares as a single collection; colors are set per date
+        cells = PolyCollection(
+            _cell_vertices(y_positions, x_positions),
+            edgecolors="black",
+            linewidths=1,
+        )
+        ax.add_collection(cells)
 
-        ax.set_title(title, fontsize=14, fontweight="bold")
+        # Add a value label inside each square
+        texts = [
+            ax.text(x, y, "", ha="center", va="center", fontsize=8)
+            for x, y in zip(x_positions.tolist(), y_positions.tolist())
+        ]
 
         # Set axis limits with padding
-        if x_positions and y_positions:
-            x_min, x_max = min(x_positions), max(x_positions)
-            y_min, y_max = min(y_positions), max(y_positions)
-            padding = 0.5
-            ax.set_xlim(x_min - padding, x_max + padding)
-            ax.set_ylim(y_min - padding, y_max + padding)
+        padding = 0.5
+        ax.set_xlim(x_positions.min() - padding, x_positions.max() + padding)
+        ax.set_ylim(y_positions.min() - padding, y_positions.max() + padding)
 
         # Remove axis ticks and labels
         ax.set_xticks([])
@@ -472,25 +873,96 @@ class GridVisualizationService:
 
         # Add colorbar
         cbar = fig.colorbar(
-            plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(vmin=vmin, vmax=vmax)),
+            ScalarMappable(cmap=cmap, norm=Normalize(vmin=vmin, vmax=vmax)),
             ax=ax,
         )
-        cbar.set_label(f"{display_name}")
+        cbar.set_label(format_parameter_name(ageing_factor_type))
 
         # Invert y-axis to match original grid layout
         ax.invert_yaxis()
         ax.set_aspect("equal")
 
-        # Adjust layout
-        fig.tight_layout()
+        if for_gif:
+            fig.subplots_adjust(left=0.05, right=0.95, top=0.9, bottom=0.05)
 
-        return fig
+        return fig, _GridFigureState(ax, cells, texts, keys, cmap, vmin, vmax)
+
+    @staticmethod
+    def _update_grid_figure(
+        state: _GridFigureState, ageing_factors: Dict[str, float], title: str
+    ) -> None:
+        """Show one date's ageing factors in a figure from _build_grid_figure.
+
+        Args:
+            state: Per-frame state returned by _build_grid_figure
+            ageing_factors: Dictionary mapping PM:Channel to ageing factor values
+            title: Figure title
+        """
+        # Channels without data default to 1.0
+        values = np.fromiter(
+            (ageing_factors.get(key, 1.0) for key in state.keys),
+            dtype=np.float64,
+            count=len(state.keys),
+        )
+
+        # Normalize and color all values in one pass; text is black on the
+        # light middle of the colormap and white towards either end
+        values_normalized = np.clip(
+            (values - state.vmin) / (state.vmax - state.vmin), 0.0, 1.0
+        )
+        state.cells.set_facecolor(state.cmap(values_normalized))
+        text_colors = np.where(
+            (values_normalized > 0.3) & (values_normalized < 0.7), "black", "white"
+        )
+
+        for text, value, text_color in zip(state.texts, values.tolist(), text_colors.tolist()):
+            text.set_text(f"{value:.2f}")
+            text.set_color(text_color)
+
+        state.ax.set_title(title, fontsize=14, fontweight="bold")
+
+    @staticmethod
+    def _grid_title(
+        mapping_name: str,
+        ageing_factor_type: str,
+        selected_date: Optional[str] = None,
+        results_data: Optional[Dict] = None,
+    ) -> str:
+        """Build the title of a grid figure.
+
+        Args:
+            mapping_name: Name of the mapping for display
+            ageing_factor_type: Type of ageing factor being displayed
+            selected_date: Selected date for the visualization
+            results_data: Analysis results data for reference date extraction
+
+        Returns:
+            Title string
+        """
+        # Get reference date (first dataset is typically the reference)
+        reference_date = None
+        if results_data and results_data.get("datasets"):
+            reference_date = results_data["datasets"][0].get("date")
+
+        # Format the ageing factor type for display
+        display_name = format_parameter_name(ageing_factor_type)
+
+        # Main title with date comparison
+        if selected_date and reference_date and reference_date != selected_date:
+            return (
+                f"{display_name} - {mapping_name.upper()}\n"
+                f"{selected_date} vs {reference_date}"
+            )
+        elif selected_date:
+            return f"{display_name} - {mapping_name.upper()}\n{selected_date}"
+        else:
+            return f"{display_name} - {mapping_name.upper()}"
 
     def create_grid_gif(
         self,
         mapping_name: str,
         results_data: Dict,
-        output_path: str,
+        output_path: Union[str, Path, BinaryIO],
         colormap: str = "RdYlGn",
         vmin: float = 0.4,
         vmax: float = 1.2,
@@ -498,13 +970,23 @@ class GridVisualizationService:
         duration_ms: int = 500,
         loop: int = 0,
         custom_colormap_colors: Optional[List[str]] = None,
+        workers: Optional[int] = 1,
+        dpi: float = 100,
+        max_width: Optional[int] = None,
+        frames_per_task: Optional[int] = None,
     ) -> bool:
         """Create an animated GIF over all available dates.
 
+        Frames are independent, so with more than one worker they are
+        rendered in a pool of processes, each task handling a contiguous run
+        of dates with a single figure. Process start-up is only worth it for
+        GIFs with many frames.
+
         Args:
             mapping_name: Name of the mapping to use
             results_data: Analysis results data
-            output_path: File path to save the GIF
+            output_path: File path to save the GIF, or a binary file-like
+                object (such as io.BytesIO) to write it to
             colormap: Matplotlib colormap name or "custom"
             vmin: Minimum value for color scaling
             vmax: Maximum value for color scaling
@@ -512,10 +994,35 @@ class GridVisualizationService:
             duration_ms: Duration of each frame in milliseconds
             loop: Number of GIF loops (0 means infinite)
             custom_colormap_colors: Color list when colormap == "custom"
+            workers: Number of worker processes rendering frames; None (or 0)
+                uses the CPU count. Frames are rendered in this process when
+                this resolves to 1 or there is only one task, and the pool
+                never has more processes than tasks.
+            dpi: Resolution of the frames in dots per inch. The pixel count,
+                and with it rendering and encoding time, grows with its square.
+            max_width: Maximum frame width in pixels; the resolution is lowered
+                below dpi if needed to fit
+            frames_per_task: Number of consecutive frames each worker task
+                renders. Every task builds its own figure, so larger runs
+                amortize that cost while smaller ones balance the load
+                better. None splits the frames evenly, one run per worker.
 
         Returns:
             True if the GIF was successfully created, False otherwise
         """
+        if workers is not None and workers < 0:
+            logger.error(f"workers must be >= 0, got {workers}")
+            return False
+        if frames_per_task is not None and frames_per_task < 1:
+            logger.error(f"frames_per_task must be >= 1, got {frames_per_task}")
+            return False
+        if not dpi > 0:
+            logger.error(f"dpi must be > 0, got {dpi}")
+            return False
+        if max_width is not None and max_width < 1:
+            logger.error(f"max_width must be >= 1, got {max_width}")
+            return False
+
         try:
             from PIL import Image
         except ImportError:
@@ -529,62 +1036,84 @@ class GridVisualizationService:
             logger.error(f"Mapping '{mapping_name}' not found")
             return False
 
-        dates = self.get_available_dates(results_data)
+        dates, all_factors = self.summarize(results_data, ageing_factor_type)
         if not dates:
             logger.error("No dates available to create GIF")
             return False
 
-        frames: List[Image.Image] = []
+        # Factors and titles are cheap to compute here; rendering is the slow
+        # part and is handed to _render_frames
+        jobs = [
+            (
+                date,
+                all_factors[date],
+                self._grid_title(mapping_name, ageing_factor_type, date, results_data),
+            )
+            for date in dates
+        ]
 
-        for date in dates:
-            fig = None
-            try:
-                ageing_factors = self._extract_ageing_factors(
-                    results_data,
-                    selected_date=date,
-                    ageing_factor_type=ageing_factor_type,
-                )
-
-                fig = self._create_grid_figure(
-                    mapping_info["mapping"],
-                    ageing_factors,
-                    colormap,
-                    vmin,
-                    vmax,
-                    mapping_name,
-                    ageing_factor_type,
-                    selected_date=date,
-                    results_data=results_data,
-                    custom_colormap_colors=custom_colormap_colors,
-                )
-
-                # Render figure to an in-memory PNG and convert to PIL.Image
-                buf = io.BytesIO()
-                fig.savefig(
-                    buf, format="png", dpi=100, bbox_inches="tight", facecolor="white"
-                )
-                buf.seek(0)
-                img = Image.open(buf).convert("RGB")
-                frames.append(img)
-            except Exception as e:
-                logger.error(f"Failed to render frame for date {date}: {e}")
-            finally:
-                if fig is not None:
-                    plt.close(fig)
+        # Resolve the colormap once for all frames (and workers)
+        try:
+            cmap = self._resolve_colormap(colormap, custom_colormap_colors)
+        except KeyError as e:
+            logger.error(f"Unknown colormap {colormap!r}: {e}")
+            return False
+
+        render = functools.partial(
+            _render_frames,
+            mapping_info,
+            colormap=cmap,
+            vmin=vmin,
+            vmax=vmax,
+            ageing_factor_type=ageing_factor_type,
+            custom_colormap_colors=custom_colormap_colors,
+            dpi=dpi,
+            max_width=max_width,
+        )
+
+        try:
+            n_workers = workers or os.cpu_count() or 1
+            chunk_size = frames_per_task or -(-len(jobs) // n_workers)
+            chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+            if n_workers == 1 or len(chunks) == 1:
+                rendered = render(jobs)
+            else:
+                with ProcessPoolExecutor(max_workers=min(n_workers, len(chunks))) as executor:
+                    rendered = [rgb for chunk in executor.map(render, chunks) for rgb in chunk]
+        except Exception as e:
+            logger.error(f"Failed to render GIF frames: {e}")
+            return False
+
+        pixels = [rgb for rgb in rendered if rgb is not None]
 
-        if not frames:
+        if not pixels:
             logger.error("No frames were generated for the GIF")
             return False
 
         try:
-            # Save GIF
-            frames[0].save(
+            # Quantize every frame to one shared palette, built once from a
+            # sample of every frame so that colors first seen in later frames
+            # get palette entries too. The cells are large uniform areas, so
+            # every fourth pixel in each direction still covers all of them.
+            # With a common palette the encoder has no per-frame palette work
+            # left, so optimize is not needed.
+            sample = np.concatenate([rgb[::4, ::4] for rgb in pixels])
+            palette = Image.fromarray(sample).quantize(method=Image.Quantize.FASTOCTREE)
+            palette_frames = [
+                Image.fromarray(rgb).quantize(palette=palette, dither=Image.Dither.NONE)
+                for rgb in pixels
+            ]
+
+            # Save GIF; the format is given explicitly since file-like
+            # objects have no extension to infer it from
+            palette_frames[0].save(
                 output_path,
+                format="GIF",
                 save_all=True,
-                append_images=frames[1:],
+                append_images=palette_frames[1:],
                 duration=duration_ms,
                 loop=loop,
-                optimize=True,
+                optimize=False,
             )
             logger.info(f"Saved grid visualization GIF to {output_path}")
             return True
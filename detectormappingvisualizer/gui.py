@@ -2,35 +2,130 @@
 GUI module for Detector Mapping Visualizer using tkinter.
 """
 
+import functools
+import itertools
 import logging
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
-import matplotlib
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
+import numpy as np
 
 from detectormappingvisualizer.data_loader import DataLoader, DataValidationError
-from detectormappingvisualizer.grid_visualization_service import (
-    GridVisualizationService,
-)
 
-# Use TkAgg backend for matplotlib
-matplotlib.use("TkAgg")
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    from matplotlib.colors import Colormap, Normalize
+    from matplotlib.figure import Figure
+
+    from detectormappingvisualizer.grid_visualization_service import GridVisualizationService
+
+# matplotlib and the visualization service (which imports matplotlib) are
+# imported when the window is built, not when this module is imported, so
+# importing the package does not pay for them or switch the backend.
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _use_tk_backend() -> None:
+    """Select matplotlib's TkAgg backend; only the first call has an effect."""
+    import matplotlib
+
+    matplotlib.use("TkAgg")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cmap(name: str) -> "Colormap":
+    """Look up a registered matplotlib colormap by name.
+
+    Args:
+        name: Colormap name (e.g., 'RdYlGn')
+
+    Returns:
+        The colormap instance
+    """
+    from matplotlib import colormaps
+
+    return colormaps[name]
+
+
+def _label_colors(values: np.ndarray, norm: "Normalize") -> np.ndarray:
+    """Pick a readable text color for each cell value.
+
+    Args:
+        values: Cell values
+        norm: Normalization used to color the cells
+
+    Returns:
+        Array of 'black' or 'white', one per value
+    """
+    values_normalized = np.clip(np.ma.getdata(norm(values)), 0.0, 1.0)
+    return np.where((values_normalized > 0.3) & (values_normalized < 0.7), "black", "white")
+
+
+def _cell_values(keys: List[str], factors: Dict[str, float]) -> np.ndarray:
+    """Look up the ageing factor of each mapped cell.
+
+    The lookups run as map(dict.get) in C rather than in a Python-level
+    generator; cells without a factor get 1.0.
+
+    Args:
+        keys: PM:Channel key of each cell, in mapping order
+        factors: Ageing factors keyed by PM:Channel
+
+    Returns:
+        Array of cell values in mapping order
+    """
+    count = len(keys)
+    return np.fromiter(
+        map(factors.get, keys, itertools.repeat(1.0, count)), dtype=np.float64, count=count
+    )
+
+
+def _write_example_data(file_path: str, detector: str) -> Dict[str, Any]:
+    """Generate example data for a detector and save it as JSON.
+
+    Args:
+        file_path: Path to write the JSON file to
+        detector: Detector type ('fta' or 'ftc')
+
+    Returns:
+        The generated data
+    """
+    example_data = DataLoader.create_example_data(
+        detector_type=detector,
+        num_datasets=5,
+        modules_per_dataset=3,
+        channels_per_module=12
+    )
+
+    DataLoader.save_to_file(example_data, file_path)
+
+    return example_data
+
+
 class DetectorMappingVisualizerGUI:
     """Main GUI application for Detector Mapping Visualizer."""
 
-    def __init__(self, root: tk.Tk):
+    # Delay used to collapse bursts of toolbar events into one refresh
+    _REFRESH_DELAY_MS = 50
+
+    # How often to check whether a background load has finished
+    _POLL_INTERVAL_MS = 50
+
+    # Cell values are not drawn when cells are narrower than this many pixels
+    _MIN_LABEL_CELL_PX = 25
+
+    def __init__(self, root: tk.Tk, service: Optional["GridVisualizationService"] = None):
         """Initialize the GUI application.
 
         Args:
             root: The root tkinter window
+            service: Visualization service to use; a new one loading the
+                built-in mappings is created if not given
         """
         self.root = root
         self.root.title("Detector Mapping Visualizer - FIT Detector Toolkit")
@@ -38,9 +133,18 @@ class DetectorMappingVisualizerGUI:
 
         # Data and service
         self.data = None
-        self.service = GridVisualizationService()
+        if service is None:
+            from detectormappingvisualizer.grid_visualization_service import (
+                GridVisualizationService,
+            )
+
+            service = GridVisualizationService()
+        self.service = service
         self.current_file = None
 
+        # File loading and writing run here to keep the Tk thread responsive
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+
         # Custom colormap
         self.custom_colormap_colors = [
             "#000000",  # Black
@@ -59,6 +163,21 @@ class DetectorMappingVisualizerGUI:
             "#207311",  # Darker green
             "#016300",  # Very dark green
         ]
+        from matplotlib.colors import ListedColormap, to_rgba_array
+
+        self._custom_cmap = ListedColormap(
+            to_rgba_array(self.custom_colormap_colors), name="fit_custom"
+        )
+
+        # Cell corner arrays per detector; mappings do not change once loaded
+        self._vertex_cache: Dict[str, np.ndarray] = {}
+
+        # Extracted factors per (date, factor type) for the loaded data
+        self._factors_cache = functools.lru_cache(maxsize=16)(self._extract_factors)
+
+        # Per-detector artists and the settings they were drawn with
+        self._plot_states: Dict[str, Dict[str, Any]] = {}
+        self._pending_refresh: Optional[str] = None
 
         # Visualization settings
         self.selected_date = tk.StringVar(value="Latest")
@@ -67,6 +186,7 @@ class DetectorMappingVisualizerGUI:
         self.custom_title = tk.StringVar(value="")
         self.vmin = tk.DoubleVar(value=0.4)
         self.vmax = tk.DoubleVar(value=1.2)
+        self.show_values = tk.BooleanVar(value=True)
 
         # Create UI
         self._create_menu()
@@ -100,6 +220,8 @@ class DetectorMappingVisualizerGUI:
         menubar.add_cascade(label="View", menu=view_menu)
         view_menu.add_command(label="Refresh Visualizations", command=self.refresh_visualizations)
         view_menu.add_command(label="Reset View", command=self.reset_view)
+        view_menu.add_separator()
+        view_menu.add_command(label="Data Info...", command=self.show_data_info)
 
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -136,7 +258,7 @@ class DetectorMappingVisualizerGUI:
             width=15
         )
         self.date_combo.pack(side=tk.LEFT, padx=5)
-        self.date_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_visualizations())
+        self.date_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_refresh())
 
         # Factor type selection
         ttk.Label(toolbar, text="Factor Type:").pack(side=tk.LEFT, padx=5)
@@ -147,7 +269,7 @@ class DetectorMappingVisualizerGUI:
             width=25
         )
         self.factor_combo.pack(side=tk.LEFT, padx=5)
-        self.factor_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_visualizations())
+        self.factor_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_refresh())
 
         # Separator
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, padx=10, fill=tk.Y)
@@ -162,7 +284,7 @@ class DetectorMappingVisualizerGUI:
             values=["custom", "RdYlGn", "viridis", "plasma", "coolwarm", "RdBu", "seismic"]
         )
         colormap_combo.pack(side=tk.LEFT, padx=5)
-        colormap_combo.bind("<<ComboboxSelected>>", lambda e: self.refresh_visualizations())
+        colormap_combo.bind("<<ComboboxSelected>>", lambda e: self._schedule_refresh())
 
         # Separator
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, padx=10, fill=tk.Y)
@@ -175,8 +297,8 @@ class DetectorMappingVisualizerGUI:
             width=8
         )
         vmin_entry.pack(side=tk.LEFT, padx=2)
-        vmin_entry.bind("<KeyRelease>", lambda e: self.refresh_visualizations())
-        vmin_entry.bind("<Return>", lambda e: self.refresh_visualizations())
+        vmin_entry.bind("<KeyRelease>", lambda e: self._schedule_refresh())
+        vmin_entry.bind("<Return>", lambda e: self._schedule_refresh())
         
         ttk.Label(toolbar, text="Max:").pack(side=tk.LEFT, padx=(5, 2))
         vmax_entry = ttk.Entry(
@@ -185,8 +307,16 @@ class DetectorMappingVisualizerGUI:
             width=8
         )
         vmax_entry.pack(side=tk.LEFT, padx=2)
-        vmax_entry.bind("<KeyRelease>", lambda e: self.refresh_visualizations())
-        vmax_entry.bind("<Return>", lambda e: self.refresh_visualizations())
+        vmax_entry.bind("<KeyRelease>", lambda e: self._schedule_refresh())
+        vmax_entry.bind("<Return>", lambda e: self._schedule_refresh())
+
+        # Cell value labels
+        ttk.Checkbutton(
+            toolbar,
+            text="Show values",
+            variable=self.show_values,
+            command=self.toggle_values
+        ).pack(side=tk.LEFT, padx=(10, 2))
 
         # Separator
         ttk.Separator(toolbar, orient=tk.VERTICAL).pack(side=tk.LEFT, padx=10, fill=tk.Y)
@@ -199,7 +329,7 @@ class DetectorMappingVisualizerGUI:
             width=30
         )
         custom_title_entry.pack(side=tk.LEFT, padx=5)
-        custom_title_entry.bind("<KeyRelease>", lambda e: self.refresh_visualizations())
+        custom_title_entry.bind("<KeyRelease>", lambda e: self._schedule_refresh())
         
         # Clear button
         clear_title_btn = ttk.Button(
@@ -221,6 +351,10 @@ class DetectorMappingVisualizerGUI:
 
     def _create_main_layout(self):
         """Create the main layout with two grid visualizations."""
+        _use_tk_backend()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+
         # Main container
         main_frame = ttk.Frame(self.root)
         main_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -238,7 +372,7 @@ class DetectorMappingVisualizerGUI:
         fta_frame.rowconfigure(0, weight=1)
         fta_frame.columnconfigure(0, weight=1)
 
-        self.fta_figure = Figure(figsize=(8, 7), dpi=100)
+        self.fta_figure = Figure(figsize=(8, 7), dpi=100, constrained_layout=True)
         self.fta_canvas = FigureCanvasTkAgg(self.fta_figure, master=fta_frame)
         self.fta_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
 
@@ -247,6 +381,7 @@ class DetectorMappingVisualizerGUI:
         fta_toolbar_frame.grid(row=1, column=0, sticky="ew")
         self.fta_toolbar = NavigationToolbar2Tk(self.fta_canvas, fta_toolbar_frame)
         self.fta_toolbar.update()
+        self.fta_canvas.mpl_connect("draw_event", lambda event: self._on_draw("fta"))
 
         # Right panel - FTC detector
         ftc_frame = ttk.LabelFrame(main_frame, text="FTC Detector", padding="10")
@@ -256,7 +391,7 @@ class DetectorMappingVisualizerGUI:
         ftc_frame.rowconfigure(0, weight=1)
         ftc_frame.columnconfigure(0, weight=1)
 
-        self.ftc_figure = Figure(figsize=(8, 7), dpi=100)
+        self.ftc_figure = Figure(figsize=(8, 7), dpi=100, constrained_layout=True)
         self.ftc_canvas = FigureCanvasTkAgg(self.ftc_figure, master=ftc_frame)
         self.ftc_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
 
@@ -265,6 +400,7 @@ class DetectorMappingVisualizerGUI:
         ftc_toolbar_frame.grid(row=1, column=0, sticky="ew")
         self.ftc_toolbar = NavigationToolbar2Tk(self.ftc_canvas, ftc_toolbar_frame)
         self.ftc_toolbar.update()
+        self.ftc_canvas.mpl_connect("draw_event", lambda event: self._on_draw("ftc"))
 
     def _create_status_bar(self):
         """Create the status bar."""
@@ -290,6 +426,16 @@ class DetectorMappingVisualizerGUI:
         )
         self.file_label.pack(side=tk.RIGHT)
 
+        # Short summary of the loaded data; the full one is under View > Data Info
+        self.summary_var = tk.StringVar(value="")
+        ttk.Label(
+            status_frame,
+            textvariable=self.summary_var,
+            relief=tk.SUNKEN,
+            anchor=tk.E,
+            padding="2"
+        ).pack(side=tk.RIGHT)
+
     def _show_welcome(self):
         """Show welcome message on both canvases."""
         for figure, detector in [(self.fta_figure, "FTA"), (self.ftc_figure, "FTC")]:
@@ -311,13 +457,41 @@ class DetectorMappingVisualizerGUI:
                 transform=ax.transAxes
             )
             ax.axis("off")
-            figure.tight_layout()
 
-        self.fta_canvas.draw()
-        self.ftc_canvas.draw()
+        self._plot_states.clear()
+        self.fta_canvas.draw_idle()
+        self.ftc_canvas.draw_idle()
+
+    def _show_busy_status(self, text: str):
+        """Show a status message right away, before a long-running step.
+
+        Only pending redraws are flushed; unlike root.update(), this does not
+        process user input in the middle of the calling handler.
+
+        Args:
+            text: Status message
+        """
+        self.status_label.config(text=text)
+        self.status_label.update_idletasks()
+
+    def _when_done(self, future: Future, callback: Callable[[Future], None]):
+        """Call a function on the Tk thread once a background task finishes.
+
+        Args:
+            future: Future of a task submitted to the I/O pool
+            callback: Called with the finished future
+        """
+        if future.done():
+            callback(future)
+        else:
+            self.root.after(self._POLL_INTERVAL_MS, self._when_done, future, callback)
 
     def load_data(self):
-        """Open file dialog and load JSON data."""
+        """Open file dialog and load JSON data.
+
+        The file is read and validated on a worker thread so the window stays
+        responsive; the UI is updated once loading finishes.
+        """
         file_path = filedialog.askopenfilename(
             title="Select Results JSON File",
             filetypes=[
@@ -330,13 +504,23 @@ class DetectorMappingVisualizerGUI:
         if not file_path:
             return
 
-        try:
-            self.status_label.config(text="Loading data...")
-            self.root.update()
+        self.status_label.config(text="Loading data...")
+        future = self._io_pool.submit(DataLoader.load_from_file, file_path)
+        self._when_done(future, functools.partial(self._finish_load_data, file_path))
+
+    def _finish_load_data(self, file_path: str, future: Future):
+        """Show data loaded by load_data.
 
+        Args:
+            file_path: Path of the loaded file
+            future: Finished loading task
+        """
+        try:
             # Load and validate data
-            self.data = DataLoader.load_from_file(file_path)
+            self.data = future.result()
             self.current_file = Path(file_path)
+            self._factors_cache.cache_clear()
+            self._plot_states.clear()
 
             # Update date selector
             dates = self.service.get_available_dates(self.data)
@@ -358,14 +542,7 @@ class DetectorMappingVisualizerGUI:
             )
 
             # Show data summary
-            summary = DataLoader.get_summary(self.data)
-            messagebox.showinfo(
-                "Data Loaded Successfully",
-                f"Datasets: {summary['total_datasets']}\n"
-                f"Dates: {', '.join(summary['dates'][:3])}{'...' if len(summary['dates']) > 3 else ''}\n"
-                f"Modules: {', '.join(summary['modules'])}\n"
-                f"Total Channels: {summary['total_channels']}"
-            )
+            self._update_summary()
 
             # Refresh visualizations
             self.refresh_visualizations()
@@ -382,7 +559,10 @@ class DetectorMappingVisualizerGUI:
             logger.exception("Failed to load data")
 
     def generate_example(self):
-        """Generate example data and save to file."""
+        """Generate example data and save to file.
+
+        The data is generated and written on a worker thread.
+        """
         # Ask for detector type
         detector_type = messagebox.askquestion(
             "Select Detector Type",
@@ -402,23 +582,19 @@ class DetectorMappingVisualizerGUI:
         if not file_path:
             return
 
-        try:
-            import json
-
-            self.status_label.config(text="Generating example data...")
-            self.root.update()
+        self.status_label.config(text="Generating example data...")
+        future = self._io_pool.submit(_write_example_data, file_path, detector)
+        self._when_done(future, functools.partial(self._finish_generate_example, file_path))
 
-            # Generate example data
-            example_data = DataLoader.create_example_data(
-                detector_type=detector,
-                num_datasets=5,
-                modules_per_dataset=3,
-                channels_per_module=12
-            )
+    def _finish_generate_example(self, file_path: str, future: Future):
+        """Offer to load example data written by generate_example.
 
-            # Save to file
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(example_data, f, indent=2)
+        Args:
+            file_path: Path the example data was saved to
+            future: Finished generation task
+        """
+        try:
+            example_data = future.result()
 
             self.status_label.config(text=f"✓ Generated example data: {Path(file_path).name}")
 
@@ -426,6 +602,8 @@ class DetectorMappingVisualizerGUI:
             if messagebox.askyesno("Load Example Data?", "Example data generated. Load it now?"):
                 self.current_file = Path(file_path)
                 self.data = example_data
+                self._factors_cache.cache_clear()
+                self._plot_states.clear()
 
                 # Update date selector
                 dates = self.service.get_available_dates(self.data)
@@ -441,6 +619,7 @@ class DetectorMappingVisualizerGUI:
                         self.factor_type.set(available_params[0])
 
                 self.file_label.config(text=f"File: {self.current_file.name}")
+                self._update_summary()
                 self.refresh_visualizations()
 
         except Exception as e:
@@ -448,6 +627,23 @@ class DetectorMappingVisualizerGUI:
             self.status_label.config(text="Error generating example")
             logger.exception("Failed to generate example")
 
+    def _schedule_refresh(self):
+        """Schedule a refresh, replacing any refresh that is still pending.
+
+        Toolbar events arrive in bursts while the user types or scrolls
+        through a combobox, so only the last one triggers a redraw.
+        """
+        if self._pending_refresh is not None:
+            self.root.after_cancel(self._pending_refresh)
+        self._pending_refresh = self.root.after(
+            self._REFRESH_DELAY_MS, self._run_scheduled_refresh
+        )
+
+    def _run_scheduled_refresh(self):
+        """Run a refresh scheduled by _schedule_refresh."""
+        self._pending_refresh = None
+        self.refresh_visualizations()
+
     def refresh_visualizations(self):
         """Refresh both FTA and FTC visualizations."""
         if self.data is None:
@@ -466,18 +662,20 @@ class DetectorMappingVisualizerGUI:
                 messagebox.showerror("Invalid Values", "Min and Max must be valid numbers")
                 return
 
-            self.status_label.config(text="Updating visualizations...")
-            self.root.update()
+            self._show_busy_status("Updating visualizations...")
 
             # Get selected date
             selected_date_val = self.selected_date.get()
             date = None if selected_date_val == "Latest" else selected_date_val
 
+            # Factors do not depend on the detector, so extract them once for both
+            factors = self._factors_cache(date, self.factor_type.get())
+
             # Create FTA visualization
-            self._update_visualization("fta", self.fta_figure, self.fta_canvas, date)
+            self._update_visualization("fta", self.fta_figure, self.fta_canvas, date, factors)
 
             # Create FTC visualization
-            self._update_visualization("ftc", self.ftc_figure, self.ftc_canvas, date)
+            self._update_visualization("ftc", self.ftc_figure, self.ftc_canvas, date, factors)
 
             date_str = selected_date_val if selected_date_val != "Latest" else "latest dataset"
             self.status_label.config(
@@ -492,112 +690,324 @@ class DetectorMappingVisualizerGUI:
     def _update_visualization(
         self,
         detector: str,
-        figure: Figure,
-        canvas: FigureCanvasTkAgg,
-        date: Optional[str]
+        figure: "Figure",
+        canvas: "FigureCanvasTkAgg",
+        date: Optional[str],
+        factors: Optional[Dict[str, float]] = None
     ):
         """Update a single visualization.
 
+        The figure is only rebuilt when the date, factor type or title change.
+        A colormap or range change recolors the existing artists, and nothing
+        is redrawn if the settings are unchanged.
+
         Args:
             detector: Detector name ('fta' or 'ftc')
             figure: Matplotlib figure to update
             canvas: Canvas to draw on
             date: Selected date or None for latest
+            factors: Ageing factors for the date, extracted here if not given
         """
-        # Check if mapping exists
-        if not self.service.get_mapping(detector):
-            figure.clear()
-            ax = figure.add_subplot(111)
-            ax.text(
-                0.5, 0.5,
-                f"No mapping available for {detector.upper()}",
-                ha="center", va="center",
-                fontsize=14,
-                color="red",
-                transform=ax.transAxes
-            )
-            ax.axis("off")
-            figure.tight_layout()
-            canvas.draw()
+        data_key = (date, self.factor_type.get(), self.custom_title.get(), self.show_values.get())
+        style_key = (self.colormap.get(), self.vmin.get(), self.vmax.get())
+
+        state = self._plot_states.get(detector)
+        if state is not None and state["key"] == data_key:
+            if state["style"] != style_key:
+                if state["cells"] is not None:
+                    self._restyle_visualization(state, canvas)
+                state["style"] = style_key
             return
 
-        # Extract aging factors
-        factors = self.service._extract_ageing_factors(
+        previous = self._plot_states.pop(detector, None)
+        state = self._draw_visualization(
+            detector, figure, canvas, date, factors, previous
+        ) or {"cells": None}
+        state["key"] = data_key
+        state["style"] = style_key
+        self._plot_states[detector] = state
+
+    def _extract_factors(self, date: Optional[str], factor_type: str) -> Dict[str, float]:
+        """Extract ageing factors from the loaded data.
+
+        Called through self._factors_cache, which is cleared whenever new data
+        is loaded; the returned dictionary is shared and must not be modified.
+
+        Args:
+            date: Selected date or None for latest
+            factor_type: Ageing factor type to extract
+
+        Returns:
+            Dictionary mapping PM:Channel to ageing factor
+        """
+        return self.service._extract_ageing_factors(
             self.data,
             selected_date=date,
-            ageing_factor_type=self.factor_type.get()
+            ageing_factor_type=factor_type
         )
 
-        if not factors:
-            figure.clear()
-            ax = figure.add_subplot(111)
-            ax.text(
-                0.5, 0.5,
-                f"No data available for {detector.upper()}",
-                ha="center", va="center",
-                fontsize=14,
-                color="orange",
-                transform=ax.transAxes
-            )
-            ax.axis("off")
-            figure.tight_layout()
-            canvas.draw()
+    def _get_cell_vertices(self, detector: str, mapping_info: Dict[str, Any]) -> np.ndarray:
+        """Return the cell corner array for a detector, computing it once.
+
+        Args:
+            detector: Detector name ('fta' or 'ftc')
+            mapping_info: Mapping information from the service
+
+        Returns:
+            Array of shape (N, 4, 2) with the corners of each cell
+        """
+        vertices = self._vertex_cache.get(detector)
+        if vertices is None:
+            from detectormappingvisualizer.grid_visualization_service import _cell_vertices
+
+            vertices = _cell_vertices(mapping_info["rows"], mapping_info["cols"])
+            self._vertex_cache[detector] = vertices
+        return vertices
+
+    def _get_display_cmap(self) -> "Colormap":
+        """Return the colormap currently selected in the toolbar."""
+        if self.colormap.get() == "custom":
+            return self._custom_cmap
+        return _get_cmap(self.colormap.get())
+
+    def _apply_color_scale(self, cells: Any, cbar: Any):
+        """Apply the current colormap and range to a cell collection and its colorbar.
+
+        The range is changed on the collection's existing norm, so the
+        colorbar keeps its locator and formatter. Change notifications are
+        held back while both settings change, so the colorbar redraws once.
+
+        Args:
+            cells: Cell collection
+            cbar: Colorbar attached to the collection
+        """
+        with cells.callbacks.blocked(), cells.norm.callbacks.blocked():
+            cells.set_cmap(self._get_display_cmap())
+            cells.set_clim(self.vmin.get(), self.vmax.get())
+        cbar.update_normal(cells)
+
+    def _restyle_visualization(self, state: Dict[str, Any], canvas: "FigureCanvasTkAgg"):
+        """Apply the current colormap and range to an existing visualization.
+
+        Args:
+            state: Plot state returned by _draw_visualization
+            canvas: Canvas to draw on
+        """
+        cells = state["cells"]
+        self._apply_color_scale(cells, state["cbar"])
+
+        label_colors = _label_colors(state["values"], cells.norm).tolist()
+        for text, text_color in zip(state["texts"], label_colors):
+            text.set_color(text_color)
+
+        # Only the recolored artists changed; blit them over the saved background
+        background = state.get("background")
+        if background is None:
+            canvas.draw_idle()
             return
 
-        # Create visualization
-        mapping_info = self.service.get_mapping(detector)
-        figure.clear()
+        canvas.restore_region(background)
+        self._draw_animated(state)
+        canvas.blit(canvas.figure.bbox)
+
+    @staticmethod
+    def _animated_artists(state: Dict[str, Any]) -> List[Any]:
+        """Return the artists of a plot that change when it is recolored.
 
-        # Create the grid on the figure
-        from detectormappingvisualizer.grid_visualization_service import plt
+        Args:
+            state: Plot state returned by _draw_visualization
+
+        Returns:
+            The cell collection, the value labels and the colorbar axes
+        """
+        return [state["cells"], *state["texts"], state["cbar"].ax]
 
+    def _draw_animated(self, state: Dict[str, Any]):
+        """Draw the recolorable artists of a plot onto its canvas buffer.
+
+        Args:
+            state: Plot state returned by _draw_visualization
+        """
+        figure = state["ax"].figure
+        for artist in self._animated_artists(state):
+            figure.draw_artist(artist)
+
+    def _on_draw(self, detector: str):
+        """Save the static background after a full draw and add the recolorable artists.
+
+        The recolorable artists are marked animated, so full draws leave them
+        out. The background without them is kept for _restyle_visualization,
+        which only redraws and blits those artists. A full draw (including
+        one caused by resizing the window) saves a fresh background.
+
+        Args:
+            detector: Detector name ('fta' or 'ftc')
+        """
+        state = self._plot_states.get(detector)
+        if state is None or state["cells"] is None:
+            return
+
+        canvas = state["ax"].figure.canvas
+        state["background"] = canvas.copy_from_bbox(canvas.figure.bbox)
+        self._draw_animated(state)
+
+    def _show_message(
+        self,
+        figure: "Figure",
+        canvas: "FigureCanvasTkAgg",
+        message: str,
+        color: str,
+        previous: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Replace a figure's contents with a single centered message.
+
+        Nothing is redrawn if the figure already shows the same message.
+
+        Args:
+            figure: Matplotlib figure to update
+            canvas: Canvas to draw on
+            message: Text to show
+            color: Text color
+            previous: Plot state from the last draw of this figure, if any
+
+        Returns:
+            Plot state for the placeholder
+        """
+        state = {"cells": None, "message": message}
+        if previous is not None and previous.get("message") == message:
+            return state
+
+        figure.clear()
         ax = figure.add_subplot(111)
+        ax.text(
+            0.5, 0.5,
+            message,
+            ha="center", va="center",
+            fontsize=14,
+            color=color,
+            transform=ax.transAxes
+        )
+        ax.axis("off")
+        canvas.draw_idle()
+        return state
 
-        # Get colormap
-        if self.colormap.get() == "custom":
-            from matplotlib.colors import ListedColormap
-            cmap = ListedColormap(self.custom_colormap_colors)
-        else:
-            cmap = plt.get_cmap(self.colormap.get())
+    def _draw_visualization(
+        self,
+        detector: str,
+        figure: "Figure",
+        canvas: "FigureCanvasTkAgg",
+        date: Optional[str],
+        factors: Optional[Dict[str, float]] = None,
+        previous: Optional[Dict[str, Any]] = None
+    ):
+        """Redraw a single visualization.
+
+        If the figure already shows a grid, its cell collection, labels and
+        colorbar are updated in place; otherwise the figure is cleared and
+        rebuilt.
+
+        Args:
+            detector: Detector name ('fta' or 'ftc')
+            figure: Matplotlib figure to update
+            canvas: Canvas to draw on
+            date: Selected date or None for latest
+            factors: Ageing factors for the date, extracted here if not given
+            previous: Plot state from the last draw of this figure, if any
+
+        Returns:
+            Dictionary with the axes, cell collection, colorbar, value labels
+            and cell values; 'cells' is None if a placeholder message was drawn
+        """
+        # Check if mapping exists
+        mapping_info = self.service.get_mapping(detector)
+        if not mapping_info or not len(mapping_info["keys"]):
+            return self._show_message(
+                figure, canvas, f"No mapping available for {detector.upper()}", "red", previous
+            )
+
+        # Extract aging factors
+        if factors is None:
+            factors = self._factors_cache(date, self.factor_type.get())
+
+        if not factors:
+            return self._show_message(
+                figure, canvas, f"No data available for {detector.upper()}", "orange", previous
+            )
 
         # Collect data points
-        x_positions = []
-        y_positions = []
-        values = []
-
-        for pm_channel, (row, col) in mapping_info["mapping"].items():
-            value = factors.get(pm_channel, 1.0)
-            x_positions.append(col)
-            y_positions.append(row)
-            values.append(value)
-
-        if not values:
-            ax.text(0.5, 0.5, "No data available", ha="center", va="center")
+        x_positions = mapping_info["cols"]
+        y_positions = mapping_info["rows"]
+        values = _cell_values(mapping_info["keys"], factors)
+
+        if previous is not None and previous["cells"] is not None:
+            # The grid layout never changes for a detector, so only the values,
+            # colors and labels of the existing artists need updating
+            ax = previous["ax"]
+            cells = previous["cells"]
+            cbar = previous["cbar"]
+            old_texts = previous["texts"]
+            cells.set_array(values)
+            self._apply_color_scale(cells, cbar)
+        else:
+            from matplotlib.collections import PolyCollection
+            from matplotlib.colors import Normalize
+
+            figure.clear()
+            ax = figure.add_subplot(111)
+            old_texts = []
+
+            # Draw all squares as one collection colored from the values
+            # Colors are mapped from the values in one vectorized pass at draw time.
+            # The mappings place cells at fractional positions (e.g. col 3.675),
+            # so the cells do not form a dense grid that imshow could draw.
+            cells = PolyCollection(
+                self._get_cell_vertices(detector, mapping_info),
+                array=values,
+                cmap=self._get_display_cmap(),
+                norm=Normalize(vmin=self.vmin.get(), vmax=self.vmax.get()),
+                edgecolors="black",
+                linewidths=0.5,
+            )
+            ax.add_collection(cells)
+
+            # Set axis limits
+            padding = 0.5
+            ax.set_xlim(x_positions.min() - padding, x_positions.max() + padding)
+            ax.set_ylim(y_positions.min() - padding, y_positions.max() + padding)
+
+            # Remove axis ticks
             ax.set_xticks([])
             ax.set_yticks([])
             ax.set_frame_on(False)
-            figure.tight_layout()
-            canvas.draw()
-            return
 
-        # Create squares for each position
-        for x, y, value in zip(x_positions, y_positions, values):
-            value_normalized = max(0, min(1, (value - self.vmin.get()) / (self.vmax.get() - self.vmin.get())))
-            rect = plt.Rectangle(
-                (x - 0.5, y - 0.5),
-                1, 1,
-                facecolor=cmap(value_normalized),
-                edgecolor="black",
-                linewidth=0.5
-            )
-            ax.add_patch(rect)
-
-        # Add values inside each square
-        for x, y, value in zip(x_positions, y_positions, values):
-            text = f"{value:.2f}"
-            value_normalized = (value - self.vmin.get()) / (self.vmax.get() - self.vmin.get())
-            text_color = "black" if 0.3 < value_normalized < 0.7 else "white"
-            ax.text(x, y, text, ha="center", va="center", color=text_color, fontsize=7)
+            # Add colorbar
+            cbar = figure.colorbar(cells, ax=ax, fraction=0.046, pad=0.04)
+
+            # Invert y-axis and set aspect
+            ax.invert_yaxis()
+            ax.set_aspect("equal")
+
+        # Add values inside each square, unless the cells are too small to read them
+        cell_px = figure.get_figwidth() * figure.dpi / (np.ptp(x_positions) + 1)
+        if self.show_values.get() and cell_px >= self._MIN_LABEL_CELL_PX:
+            labels = np.char.mod("%.2f", values).tolist()
+            text_colors = _label_colors(values, cells.norm).tolist()
+            if old_texts:
+                for text, label, text_color in zip(old_texts, labels, text_colors):
+                    text.set_text(label)
+                    text.set_color(text_color)
+                texts = old_texts
+            else:
+                texts = [
+                    ax.text(x, y, label, ha="center", va="center", color=text_color, fontsize=7)
+                    for x, y, label, text_color in zip(
+                        x_positions.tolist(), y_positions.tolist(), labels, text_colors
+                    )
+                ]
+        else:
+            for text in old_texts:
+                text.remove()
+            texts = []
 
         # Set title
         from detectormappingvisualizer.grid_visualization_service import format_parameter_name
@@ -611,35 +1021,16 @@ class DetectorMappingVisualizerGUI:
         date_str = date if date else "Latest"
         title = f"{display_name} - {detector.upper()}\n{date_str}"
         ax.set_title(title, fontsize=10, fontweight="bold")
-
-        # Set axis limits
-        if x_positions and y_positions:
-            x_min, x_max = min(x_positions), max(x_positions)
-            y_min, y_max = min(y_positions), max(y_positions)
-            padding = 0.5
-            ax.set_xlim(x_min - padding, x_max + padding)
-            ax.set_ylim(y_min - padding, y_max + padding)
-
-        # Remove axis ticks
-        ax.set_xticks([])
-        ax.set_yticks([])
-        ax.set_frame_on(False)
-
-        # Add colorbar
-        sm = plt.cm.ScalarMappable(
-            cmap=cmap,
-            norm=plt.Normalize(vmin=self.vmin.get(), vmax=self.vmax.get())
-        )
-        sm.set_array([])
-        cbar = figure.colorbar(sm, ax=ax, fraction=0.046, pad=0.04)
         cbar.set_label(display_name, fontsize=8)
 
-        # Invert y-axis and set aspect
-        ax.invert_yaxis()
-        ax.set_aspect("equal")
+        state = {"ax": ax, "cells": cells, "cbar": cbar, "texts": texts, "values": values}
+        for artist in self._animated_artists(state):
+            artist.set_animated(True)
+
+        # The figure uses constrained layout, so no tight_layout pass is needed
+        canvas.draw_idle()
 
-        figure.tight_layout()
-        canvas.draw()
+        return state
 
     def export_visualization(self, detector: str, format: str):
         """Export a visualization to file.
@@ -663,20 +1054,35 @@ class DetectorMappingVisualizerGUI:
             return
 
         try:
-            self.status_label.config(text=f"Exporting {detector.upper()} visualization...")
-            self.root.update()
+            self._show_busy_status(f"Exporting {detector.upper()} visualization...")
 
             # Get the appropriate figure
             figure = self.fta_figure if detector == "fta" else self.ftc_figure
 
+            # Animated artists are skipped by savefig, so include them for the export
+            state = self._plot_states.get(detector)
+            animated = []
+            if state is not None and state["cells"] is not None:
+                animated = self._animated_artists(state)
+            for artist in animated:
+                artist.set_animated(False)
+
             # Save the figure
-            figure.savefig(
-                file_path,
-                format=format,
-                dpi=300,
-                bbox_inches="tight",
-                facecolor="white"
-            )
+            try:
+                figure.savefig(
+                    file_path,
+                    format=format,
+                    dpi=300,
+                    bbox_inches="tight",
+                    facecolor="white"
+                )
+            finally:
+                for artist in animated:
+                    artist.set_animated(True)
+                # The export rendered at a different size; save a new background
+                if animated:
+                    state["background"] = None
+                    figure.canvas.draw_idle()
 
             self.status_label.config(text=f"✓ Exported to {Path(file_path).name}")
             messagebox.showinfo("Success", f"Visualization exported to:\n{file_path}")
@@ -686,12 +1092,40 @@ class DetectorMappingVisualizerGUI:
             self.status_label.config(text="Error exporting visualization")
             logger.exception("Failed to export visualization")
 
+    def _update_summary(self):
+        """Show a short summary of the loaded data in the status bar."""
+        summary = DataLoader.get_summary(self.data)
+        self.summary_var.set(
+            f"{summary['total_datasets']} datasets · {summary['total_channels']} channels"
+        )
+
+    def show_data_info(self):
+        """Show a summary of the loaded data."""
+        if self.data is None:
+            messagebox.showwarning("No Data", "Please import data first")
+            return
+
+        summary = DataLoader.get_summary(self.data)
+        dates = summary["dates"]
+        messagebox.showinfo(
+            "Data Info",
+            f"Datasets: {summary['total_datasets']}\n"
+            f"Dates: {', '.join(dates[:3])}{'...' if len(dates) > 3 else ''}\n"
+            f"Modules: {', '.join(summary['modules'])}\n"
+            f"Total Channels: {summary['total_channels']}"
+        )
+
     def clear_custom_title(self):
         """Clear the custom title field."""
         self.custom_title.set("")
         if self.data is not None:
             self.refresh_visualizations()
 
+    def toggle_values(self):
+        """Redraw after the 'Show values' checkbox changes."""
+        if self.data is not None:
+            self._schedule_refresh()
+
     def reset_view(self):
         """Reset visualization settings to defaults."""
         self.factor_type.set("normalized_gauss_ageing_factor")
@@ -700,6 +1134,7 @@ class DetectorMappingVisualizerGUI:
         self.vmax.set(1.2)
         self.selected_date.set("Latest")
         self.custom_title.set("")
+        self.show_values.set(True)
 
         if self.data is not None:
             self.refresh_visualizations()
@@ -717,10 +1152,14 @@ class DetectorMappingVisualizerGUI:
         )
 
 
-def launch_gui():
-    """Launch the GUI application."""
+def launch_gui(service: Optional["GridVisualizationService"] = None):
+    """Launch the GUI application.
+
+    Args:
+        service: Visualization service to use; a new one is created if not given
+    """
     root = tk.Tk()
-    app = DetectorMappingVisualizerGUI(root)
+    app = DetectorMappingVisualizerGUI(root, service=service)
     root.mainloop()
 
 
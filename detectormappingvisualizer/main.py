@@ -6,27 +6,101 @@ when the module is launched from the FIT Detector Toolkit or run standalone.
 """
 
 import argparse
+import functools
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional, TypeVar
 
 from detectormappingvisualizer.data_loader import DataLoader, DataValidationError
-from detectormappingvisualizer.grid_visualization_service import (
-    GridVisualizationService,
-)
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+    from detectormappingvisualizer.grid_visualization_service import GridVisualizationService
+
 logger = logging.getLogger(__name__)
 
+_Number = TypeVar("_Number", int, float)
+
+# Output formats written by _save_raster, mapped to their Pillow format names
+_RASTER_FORMATS = {"png": "PNG", "jpg": "JPEG", "jpeg": "JPEG"}
+
+
+@functools.lru_cache(maxsize=4)
+def _get_service(mappings_dir: Optional[str] = None) -> "GridVisualizationService":
+    """Return a GridVisualizationService, shared per mappings directory.
+
+    Creating a service parses every mapping CSV, so repeated CLI actions
+    reuse one instance. The CLI never modifies a service after creating it.
+
+    Args:
+        mappings_dir: Optional custom mappings directory
+
+    Returns:
+        GridVisualizationService for the mappings directory
+    """
+    # Imported here so that commands which don't plot never load matplotlib
+    from detectormappingvisualizer.grid_visualization_service import (
+        GridVisualizationService,
+    )
+
+    return GridVisualizationService(mappings_dir=mappings_dir)
+
+
+def _configure_logging(verbose: bool = False) -> None:
+    """Set up logging for the command-line and GUI entry points.
+
+    This runs from main() rather than at import time, so importing the
+    module never installs handlers in a host application (such as the FIT
+    Detector Toolkit) that configures logging itself.
+
+    Args:
+        verbose: Enable debug logging
+    """
+    # basicConfig does nothing if the root logger already has handlers
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+
+def _at_least(
+    convert: Callable[[str], _Number], minimum: _Number, inclusive: bool = True
+) -> Callable[[str], _Number]:
+    """Build an argparse type that converts a value and enforces a lower bound.
+
+    Args:
+        convert: Conversion applied to the argument text, such as int
+        minimum: Smallest accepted value
+        inclusive: Whether minimum itself is accepted
+
+    Returns:
+        Function converting argument text, raising argparse.ArgumentTypeError
+        for values below the bound (and for NaN)
+    """
+
+    def parse(text: str) -> _Number:
+        value = convert(text)
+        # Written so that NaN, which fails every comparison, is rejected too
+        if not (value >= minimum if inclusive else value > minimum):
+            bound = f">= {minimum}" if inclusive else f"> {minimum}"
+            raise argparse.ArgumentTypeError(f"must be {bound}, got {text}")
+        return value
 
+    # argparse names the type in its "invalid <type> value" message
+    parse.__name__ = convert.__name__
+    return parse
+
+
+@functools.lru_cache(maxsize=None)
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser.
 
+    The parser is built once and shared; parsing does not modify it.
+
     Returns:
         Configured ArgumentParser instance
     """
@@ -134,6 +208,33 @@ Examples:
         default=0,
         help="Number of GIF loops (0 means infinite, default: 0)",
     )
+    parser.add_argument(
+        "--gif-workers",
+        type=_at_least(int, 0),
+        default=1,
+        help=(
+            "Number of worker processes rendering GIF frames; 0 uses the number of CPUs "
+            "(default: 1, render in this process)"
+        ),
+    )
+    parser.add_argument(
+        "--frames-per-worker",
+        type=_at_least(int, 1),
+        default=None,
+        help="Number of consecutive GIF frames per worker task (default: split evenly)",
+    )
+    parser.add_argument(
+        "--gif-dpi",
+        type=_at_least(float, 0.0, inclusive=False),
+        default=100,
+        help="Resolution of GIF frames in dots per inch (default: 100)",
+    )
+    parser.add_argument(
+        "--gif-max-width",
+        type=_at_least(int, 1),
+        default=None,
+        help="Maximum GIF frame width in pixels; lowers the resolution if needed",
+    )
 
     # Utility options
     parser.add_argument(
@@ -178,7 +279,7 @@ def list_available_mappings(mappings_dir: Optional[str] = None):
         mappings_dir: Optional custom mappings directory
     """
     try:
-        service = GridVisualizationService(mappings_dir=mappings_dir)
+        service = _get_service(mappings_dir)
         mappings = service.get_available_mappings()
 
         if not mappings:
@@ -205,8 +306,6 @@ def generate_example_data(output_path: str, detector_type: str = "fta"):
         detector_type: Type of detector (fta or ftc)
     """
     try:
-        import json
-
         example_data = DataLoader.create_example_data(
             detector_type=detector_type,
             num_datasets=5,
@@ -214,8 +313,7 @@ def generate_example_data(output_path: str, detector_type: str = "fta"):
             channels_per_module=12,
         )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(example_data, f, indent=2)
+        DataLoader.save_to_file(example_data, output_path)
 
         print(f"\n✓ Generated example data for '{detector_type}' detector")
         print(f"  Saved to: {output_path}")
@@ -226,23 +324,35 @@ def generate_example_data(output_path: str, detector_type: str = "fta"):
         sys.exit(1)
 
 
-def validate_input_data(input_path: str, show_summary: bool = False):
+def validate_input_data(input_path: str, show_summary: bool = False, stream: bool = False):
     """Validate input JSON data.
 
     Args:
         input_path: Path to input JSON file
         show_summary: Whether to show data summary
+        stream: Validate the file dataset by dataset without keeping the data,
+            for when only validation and the summary are needed. Falls back
+            to a full load if ijson is not installed.
 
     Returns:
-        Loaded and validated data dictionary
+        Loaded and validated data dictionary, or None when streaming
     """
     try:
         print(f"\nValidating input file: {input_path}")
-        data = DataLoader.load_from_file(input_path)
+        data = None
+        summary = None
+        if stream:
+            try:
+                summary = DataLoader.stream_summary(input_path)
+            except ImportError:
+                logger.debug("ijson not installed; loading the whole file to validate it")
+        if summary is None:
+            data = DataLoader.load_from_file(input_path)
         print("✓ Data validation successful!")
 
         if show_summary:
-            summary = DataLoader.get_summary(data)
+            if summary is None:
+                summary = DataLoader.get_summary(data)
             print("\nData Summary:")
             print("=" * 60)
             print(f"  Total datasets: {summary['total_datasets']}")
@@ -264,6 +374,42 @@ def validate_input_data(input_path: str, show_summary: bool = False):
         sys.exit(1)
 
 
+def _save_raster(fig: "Figure", output_path: str, image_format: str, dpi: int) -> None:
+    """Save a figure as a raster image, cropped to its contents.
+
+    Matches savefig(bbox_inches="tight", facecolor="white"), but savefig
+    draws the figure once to measure the tight bounding box and again to
+    render it. Here the figure is drawn once with Agg, cropped to the
+    bounding box measured on that draw, and written with Pillow.
+
+    Args:
+        fig: Figure to save
+        output_path: Path to the output file
+        image_format: Pillow format name (e.g. 'PNG' or 'JPEG')
+        dpi: Resolution in dots per inch
+    """
+    import numpy as np
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from PIL import Image
+
+    fig.set_dpi(dpi)
+    fig.patch.set_facecolor("white")
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+
+    # Tight bounding box in pixels, with savefig's default 0.1 inch padding
+    bbox = fig.get_tightbbox(canvas.get_renderer()).padded(0.1).transformed(fig.dpi_scale_trans)
+    width, height = canvas.get_width_height()
+    x0 = max(int(np.floor(bbox.x0)), 0)
+    x1 = min(int(np.ceil(bbox.x1)), width)
+    # Pixel rows run top to bottom, display coordinates bottom to top
+    top = max(int(np.floor(height - bbox.y1)), 0)
+    bottom = min(int(np.ceil(height - bbox.y0)), height)
+
+    pixels = np.asarray(canvas.buffer_rgba())[top:bottom, x0:x1, :3]
+    Image.fromarray(pixels).save(output_path, format=image_format, dpi=(dpi, dpi))
+
+
 def create_visualization(
     data: dict,
     output_path: str,
@@ -277,6 +423,10 @@ def create_visualization(
     create_gif: bool = False,
     gif_duration: int = 500,
     gif_loop: int = 0,
+    gif_workers: Optional[int] = 1,
+    gif_dpi: float = 100,
+    gif_max_width: Optional[int] = None,
+    frames_per_worker: Optional[int] = None,
 ):
     """Create a visualization from the data.
 
@@ -293,9 +443,15 @@ def create_visualization(
         create_gif: Whether to create an animated GIF
         gif_duration: Duration of each GIF frame in milliseconds
         gif_loop: Number of GIF loops
+        gif_workers: Number of worker processes rendering GIF frames; 1
+            renders in this process and None or 0 uses the CPU count
+        gif_dpi: Resolution of GIF frames in dots per inch
+        gif_max_width: Maximum GIF frame width in pixels
+        frames_per_worker: Number of consecutive GIF frames per worker task;
+            None splits the frames evenly between the workers
     """
     try:
-        service = GridVisualizationService(mappings_dir=mappings_dir)
+        service = _get_service(mappings_dir)
 
         # Check if the mapping exists
         if not service.get_mapping(detector):
@@ -317,6 +473,10 @@ def create_visualization(
                 ageing_factor_type=factor_type,
                 duration_ms=gif_duration,
                 loop=gif_loop,
+                workers=gif_workers,
+                dpi=gif_dpi,
+                max_width=gif_max_width,
+                frames_per_task=frames_per_worker,
             )
 
             if success:
@@ -350,14 +510,17 @@ def create_visualization(
                 output_format = "png"
                 output_path = str(Path(output_path).with_suffix(".png"))
 
-            # Save the figure
-            fig.savefig(
-                output_path,
-                format=output_format,
-                dpi=300,
-                bbox_inches="tight",
-                facecolor="white",
-            )
+            # Save the figure; raster formats skip savefig's extra layout draw
+            if output_format in _RASTER_FORMATS:
+                _save_raster(fig, output_path, _RASTER_FORMATS[output_format], dpi=300)
+            else:
+                fig.savefig(
+                    output_path,
+                    format=output_format,
+                    dpi=300,
+                    bbox_inches="tight",
+                    facecolor="white",
+                )
             print(f"✓ Visualization saved to: {output_path}")
 
     except Exception as e:
@@ -374,10 +537,9 @@ def main():
     
     If no arguments are provided, launches the GUI. Otherwise, uses CLI mode.
     """
-    import sys
-    
     # If no arguments provided (or only the script name), launch GUI
     if len(sys.argv) == 1:
+        _configure_logging()
         try:
             from detectormappingvisualizer.gui import launch_gui
             launch_gui()
@@ -397,8 +559,7 @@ def main():
     args = parser.parse_args()
 
     # Configure logging level
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    _configure_logging(args.verbose)
 
     # Print header
     print("\n" + "=" * 60)
@@ -441,13 +602,14 @@ def main():
         parser.print_help()
         sys.exit(1)
 
-    # Load and validate input data
-    data = validate_input_data(args.input, show_summary=args.summary)
-
-    # If only validation was requested, exit
+    # If only validation was requested, the data itself is not needed
     if args.validate:
+        validate_input_data(args.input, show_summary=args.summary, stream=True)
         return
 
+    # Load and validate input data
+    data = validate_input_data(args.input, show_summary=args.summary)
+
     # For visualization, output and detector are required
     if not args.output or not args.detector:
         logger.error("Both output path (-o/--output) and detector type (-d/--detector) are required for visualization")
@@ -467,6 +629,10 @@ def main():
         create_gif=args.gif,
         gif_duration=args.gif_duration,
         gif_loop=args.gif_loop,
+        gif_workers=args.gif_workers,
+        gif_dpi=args.gif_dpi,
+        gif_max_width=args.gif_max_width,
+        frames_per_worker=args.frames_per_worker,
     )
 
     print("\n✓ Process completed successfully!\n")
@@ -0,0 +1,32 @@
+"""Optional compiled build for detectormappingvisualizer.
+
+All project metadata lives in pyproject.toml. Setting DMV_USE_MYPYC=1 compiles
+the data loader's validation code into a C extension with mypyc; mypy must be
+installed in the build environment:
+
+    pip install mypy
+    DMV_USE_MYPYC=1 pip install --no-build-isolation .
+
+Without the variable the package is built as pure Python.
+
+mypyc enforces the type annotations at run time, so run the test suite
+against an in-place compiled build after changing the loader's signatures:
+
+    DMV_USE_MYPYC=1 python setup.py build_ext --inplace
+    pytest
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("DMV_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    # Only the loader is compiled; the rest of the package is not type-checked here
+    ext_modules = mypycify(
+        ["--follow-imports=silent", "detectormappingvisualizer/data_loader.py"]
+    )
+
+setup(ext_modules=ext_modules)
@@ -0,0 +1,37 @@
+"""Shared fixtures for the test suite."""
+
+import functools
+
+import pytest
+
+from detectormappingvisualizer.data_loader import DataLoader
+from detectormappingvisualizer.grid_visualization_service import GridVisualizationService
+
+
+@pytest.fixture(scope="session")
+def shared_service():
+    """GridVisualizationService for the built-in mappings, created once per session.
+
+    Tests using it must not modify the service; tests that do (for example
+    by refreshing its mappings) create their own instance.
+    """
+    return GridVisualizationService()
+
+
+@pytest.fixture(scope="session")
+def example_data():
+    """Factory for example data, shared between tests asking for the same arguments.
+
+    Calls with the same keyword arguments return the same dictionary, so the
+    data must not be modified; tests that modify it call
+    DataLoader.create_example_data themselves.
+    """
+    return functools.lru_cache(maxsize=32)(DataLoader.create_example_data)
+
+
+@pytest.fixture(scope="session")
+def example_json_path(tmp_path_factory):
+    """Path of an example data file written once per session; do not modify it."""
+    path = tmp_path_factory.mktemp("data") / "example.json"
+    DataLoader.save_to_file(DataLoader.create_example_data(), path)
+    return str(path)
@@ -1,14 +1,22 @@
 """Tests for the data_loader module."""
 
 import json
-import tempfile
-from pathlib import Path
 
+import numpy as np
 import pytest
 
+from detectormappingvisualizer import data_loader
 from detectormappingvisualizer.data_loader import DataLoader, DataValidationError
 
 
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def json_parser(request, monkeypatch):
+    """Run a test with the memory-mapped orjson parser and the stdlib fallback."""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(data_loader, "HAS_ORJSON", request.param)
+
+
 class TestDataLoader:
     """Test cases for the DataLoader class."""
 
@@ -165,43 +173,176 @@ class TestDataLoader:
         with pytest.raises(DataValidationError, match="ageing_factors"):
             DataLoader.validate_data(data)
 
-    def test_load_from_file(self):
+    def test_validate_warns_without_numeric_factors(self, caplog):
+        """Test validation accepts channels without numeric factors but warns."""
+        data = DataLoader.create_example_data(num_datasets=1)
+        data["datasets"][0]["modules"][0]["channels"][0]["ageing_factors"] = {"note": "n/a"}
+
+        # Should not raise an exception
+        DataLoader.validate_data(data)
+
+        assert "no valid ageing factors found" in caplog.text
+
+    @pytest.mark.parametrize(
+        "level,field",
+        [
+            (level, field)
+            for level, fields in DataLoader.REQUIRED_FIELDS.items()
+            for field in fields
+        ],
+    )
+    def test_fast_path_checks_required_fields(self, level, field):
+        """Test that the fast path rejects data missing any required field."""
+        data = DataLoader.create_example_data(num_datasets=1)
+        dataset = data["datasets"][0]
+        module = dataset["modules"][0]
+        target = {"dataset": dataset, "module": module, "channel": module["channels"][0]}[level]
+        assert DataLoader._check_datasets(data["datasets"]) == 1
+
+        del target[field]
+
+        assert DataLoader._check_datasets(data["datasets"]) == 0
+
+    def test_validate_resumes_after_warning(self, caplog):
+        """Test that datasets after a warning are still validated."""
+        data = DataLoader.create_example_data(num_datasets=3)
+        data["datasets"][0]["modules"][0]["channels"][0]["ageing_factors"] = {"note": "n/a"}
+        del data["datasets"][2]["date"]
+
+        with pytest.raises(DataValidationError, match="Dataset at index 2"):
+            DataLoader.validate_data(data)
+
+        assert "no valid ageing factors found" in caplog.text
+
+    def test_load_from_file(self, tmp_path, json_parser):
         """Test loading data from a JSON file."""
         data = DataLoader.create_example_data()
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
 
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            json.dump(data, f)
-            temp_path = f.name
-
-        try:
-            # Load from file
-            loaded_data = DataLoader.load_from_file(temp_path)
-            assert loaded_data == data
-        finally:
-            # Clean up
-            Path(temp_path).unlink()
+        loaded_data = DataLoader.load_from_file(str(path))
+        assert loaded_data == data
 
     def test_load_from_file_not_found(self):
         """Test loading from non-existent file."""
         with pytest.raises(FileNotFoundError):
             DataLoader.load_from_file("nonexistent_file.json")
 
-    def test_load_from_file_invalid_json(self):
+    def test_load_from_file_invalid_json(self, tmp_path, json_parser):
         """Test loading from file with invalid JSON."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            f.write("not valid json {")
-            temp_path = f.name
-
-        try:
-            with pytest.raises(json.JSONDecodeError):
-                DataLoader.load_from_file(temp_path)
-        finally:
-            Path(temp_path).unlink()
+        path = tmp_path / "invalid.json"
+        # Only documents containing the 'datasets' key reach the parser
+        path.write_text('{"datasets": [not valid json')
+
+        with pytest.raises(json.JSONDecodeError):
+            DataLoader.load_from_file(str(path))
+
+    def test_load_from_file_invalid_json_without_datasets_key(self, tmp_path, json_parser):
+        """Test that invalid JSON without a 'datasets' key reports the missing key.
+
+        Before the byte pre-check this input raised json.JSONDecodeError; now
+        corrupted or truncated files without the key get the schema error.
+        """
+        path = tmp_path / "invalid.json"
+        path.write_text("not valid json {")
+
+        with pytest.raises(DataValidationError, match="Data must contain 'datasets' key"):
+            DataLoader.load_from_file(str(path))
+
+    def test_load_from_file_without_datasets_key(self, tmp_path, json_parser):
+        """Test that files without a 'datasets' key are rejected before parsing."""
+        path = tmp_path / "other.json"
+        # Not valid JSON either: the key check must fire before the parser runs
+        path.write_text('{"results": [1, 2,')
+
+        with pytest.raises(DataValidationError, match="datasets"):
+            DataLoader.load_from_file(str(path))
+
+    @pytest.mark.parametrize("content", ["", " \n\t\r\n"], ids=["empty", "whitespace"])
+    def test_load_from_file_empty(self, tmp_path, json_parser, content):
+        """Test that empty and whitespace-only files are reported as invalid JSON."""
+        path = tmp_path / "empty.json"
+        path.write_text(content)
+
+        with pytest.raises(json.JSONDecodeError):
+            DataLoader.load_from_file(str(path))
+
+    def test_load_directory(self, tmp_path):
+        """Test loading all JSON files in a directory."""
+        fta = DataLoader.create_example_data(detector_type="fta")
+        ftc = DataLoader.create_example_data(detector_type="ftc")
+        (tmp_path / "a.json").write_text(json.dumps(fta))
+        (tmp_path / "b.json").write_text(json.dumps(ftc))
+        (tmp_path / "notes.txt").write_text("ignored")
+
+        loaded = list(DataLoader.load_directory(str(tmp_path), workers=2))
+
+        assert loaded == [fta, ftc]
+
+    def test_load_from_file_factor_types(self, tmp_path):
+        """Test that only the requested factor types are kept."""
+        data = DataLoader.create_example_data(num_datasets=2)
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+
+        loaded = DataLoader.load_from_file(str(path), factor_types=["gaussian_ageing_factor"])
+
+        for dataset, original in zip(loaded["datasets"], data["datasets"]):
+            for module, orig_module in zip(dataset["modules"], original["modules"]):
+                for channel, orig_channel in zip(module["channels"], orig_module["channels"]):
+                    assert channel["ageing_factors"] == {
+                        "gaussian_ageing_factor": orig_channel["ageing_factors"][
+                            "gaussian_ageing_factor"
+                        ]
+                    }
+
+    def test_load_from_file_cache(self, tmp_path, monkeypatch):
+        """Test that cached loads skip parsing until the file changes."""
+        monkeypatch.setattr(data_loader, "_CACHE_DIR", tmp_path / "cache")
+        data = DataLoader.create_example_data(num_datasets=2)
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+
+        assert DataLoader.load_from_file(str(path), use_cache=True) == data
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 1
+
+        def fail(_path):
+            raise AssertionError("cached load parsed the file")
+
+        with monkeypatch.context() as m:
+            m.setattr(data_loader, "_load_file", fail)
+            assert DataLoader.load_from_file(str(path), use_cache=True) == data
+
+        # A modified file gets a new cache entry
+        data["datasets"].pop()
+        path.write_text(json.dumps(data))
+        assert DataLoader.load_from_file(str(path), use_cache=True) == data
+        assert len(list((tmp_path / "cache").glob("*.pkl"))) == 2
+
+    def test_load_directory_not_found(self):
+        """Test loading from a non-existent directory."""
+        with pytest.raises(FileNotFoundError):
+            list(DataLoader.load_directory("nonexistent_directory"))
+
+    def test_load_from_file_stream(self, tmp_path):
+        """Test streaming datasets from a JSON file."""
+        pytest.importorskip("ijson")
+        data = DataLoader.create_example_data(num_datasets=3)
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+
+        datasets = list(DataLoader.load_from_file_stream(str(path)))
+
+        assert datasets == data["datasets"]
+
+    def test_load_from_file_stream_invalid_dataset(self, tmp_path):
+        """Test streaming fails on an invalid dataset."""
+        pytest.importorskip("ijson")
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps({"datasets": [{"date": "2024-01-01"}]}))
+
+        with pytest.raises(DataValidationError, match="modules"):
+            list(DataLoader.load_from_file_stream(str(path)))
 
     def test_load_from_string(self):
         """Test loading data from a JSON string."""
@@ -211,11 +352,59 @@ class TestDataLoader:
         loaded_data = DataLoader.load_from_string(json_string)
         assert loaded_data == data
 
+    def test_load_from_string_interns_names(self):
+        """Test that repeated module IDs and channel names share one object."""
+        data = DataLoader.create_example_data(num_datasets=2)
+
+        loaded = DataLoader.load_from_string(json.dumps(data))
+
+        first, second = (ds["modules"][0] for ds in loaded["datasets"])
+        assert first["identifier"] is second["identifier"]
+        assert first["channels"][0]["name"] is second["channels"][0]["name"]
+
     def test_load_from_string_invalid_json(self):
         """Test loading from invalid JSON string."""
         with pytest.raises(json.JSONDecodeError):
             DataLoader.load_from_string("not valid json")
 
+    def test_save_to_file(self, tmp_path):
+        """Test that saved data round-trips as indented JSON."""
+        data = DataLoader.create_example_data()
+        path = tmp_path / "saved.json"
+
+        DataLoader.save_to_file(data, path)
+
+        assert DataLoader.load_from_file(path) == data
+        assert path.read_text(encoding="utf-8").startswith('{\n  "datasets": [')
+
+    def test_save_to_file_numpy_values(self, tmp_path, json_parser):
+        """Test that NumPy arrays and scalars are saved as JSON numbers."""
+        factors = np.array([[0.5, 1.0], [1.5, 2.0]])
+        data = {
+            "datasets": [{"date": "2024-01-01", "values": factors[:, 0], "scale": np.float32(2)}]
+        }
+        path = tmp_path / "saved.json"
+
+        DataLoader.save_to_file(data, path)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "datasets": [{"date": "2024-01-01", "values": [0.5, 1.5], "scale": 2.0}]
+        }
+
+    def test_save_and_load_nan(self, tmp_path, json_parser):
+        """Test that NaN factors are written as the json literal and read back."""
+        data = DataLoader.create_example_data(num_datasets=1)
+        factors = data["datasets"][0]["modules"][0]["channels"][0]["ageing_factors"]
+        factors["gaussian_ageing_factor"] = float("nan")
+        path = tmp_path / "nan.json"
+
+        DataLoader.save_to_file(data, path)
+
+        assert b"NaN" in path.read_bytes()
+        loaded = DataLoader.load_from_file(path)
+        loaded_factors = loaded["datasets"][0]["modules"][0]["channels"][0]["ageing_factors"]
+        assert np.isnan(loaded_factors["gaussian_ageing_factor"])
+
     def test_get_summary(self):
         """Test getting data summary."""
         data = DataLoader.create_example_data(
@@ -230,6 +419,36 @@ class TestDataLoader:
         assert len(summary["modules"]) == 2
         assert summary["total_channels"] == 3 * 2 * 12  # datasets * modules * channels
 
+    def test_stream_summary(self, tmp_path):
+        """Test that the streamed summary matches the in-memory one."""
+        pytest.importorskip("ijson")
+        data = DataLoader.create_example_data(
+            num_datasets=3, modules_per_dataset=2, channels_per_module=12
+        )
+        path = tmp_path / "data.json"
+        path.write_text(json.dumps(data))
+
+        assert DataLoader.stream_summary(str(path)) == DataLoader.get_summary(data)
+
+    def test_extract_factor_array(self):
+        """Test extracting one factor type as a flat array."""
+        data = DataLoader.create_example_data(
+            num_datasets=2, modules_per_dataset=2, channels_per_module=3
+        )
+        channels = data["datasets"][1]["modules"][1]["channels"]
+        del channels[0]["ageing_factors"]["gaussian_ageing_factor"]
+        channels[1]["ageing_factors"]["gaussian_ageing_factor"] = "n/a"
+
+        arr = DataLoader.extract_factor_array(data, "gaussian_ageing_factor")
+
+        assert arr.dtype == np.float64
+        assert arr.shape == (12,)
+        assert arr[0] == data["datasets"][0]["modules"][0]["channels"][0]["ageing_factors"][
+            "gaussian_ageing_factor"
+        ]
+        assert np.isnan(arr[9]) and np.isnan(arr[10])
+        assert np.isnan(arr).sum() == 2
+
     def test_ageing_factor_types(self):
         """Test that all expected aging factor types are recognized."""
         expected_types = [
@@ -1,10 +1,12 @@
 """Tests for the grid_visualization_service module."""
 
-import tempfile
-from pathlib import Path
+import csv
+import io
+from concurrent.futures import ProcessPoolExecutor
 
 import pytest
 
+from detectormappingvisualizer import grid_visualization_service
 from detectormappingvisualizer.data_loader import DataLoader
 from detectormappingvisualizer.grid_visualization_service import (
     GridVisualizationService,
@@ -16,134 +18,167 @@ from detectormappingvisualizer.grid_visualization_service import (
 class TestFormatParameterName:
     """Test cases for the format_parameter_name function."""
 
-    def test_format_standard_parameter(self):
-        """Test formatting of standard parameter name."""
-        result = format_parameter_name("normalized_gauss_ageing_factor")
-        assert result == "Normalized Gauss Ageing Factor"
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("normalized_gauss_ageing_factor", "Normalized Gauss Ageing Factor"),
+            ("test_parameter", "Test Parameter"),
+            ("ageing_factor", "Ageing Factor"),
+            ("testparameter", "Testparameter"),
+        ],
+    )
+    def test_format(self, name, expected):
+        """Test formatting of parameter names, with and without underscores."""
+        assert format_parameter_name(name) == expected
 
-    def test_format_simple_parameter(self):
-        """Test formatting of simple parameter name."""
-        result = format_parameter_name("test_parameter")
-        assert result == "Test Parameter"
 
-    def test_format_single_word(self):
-        """Test formatting of single word parameter."""
-        result = format_parameter_name("ageing_factor")
-        assert result == "Ageing Factor"
+class TestNormalizePmChannel:
+    """Test cases for the normalize_pm_channel function."""
 
-    def test_format_no_underscores(self):
-        """Test formatting of parameter with no underscores."""
-        result = format_parameter_name("testparameter")
-        assert result == "Testparameter"
+    @pytest.mark.parametrize(
+        "pm, channel, expected",
+        [
+            ("A6", "CH01", "A6:CH01"),  # standard format
+            ("a6", "ch01", "A6:CH01"),  # lowercase
+            ("PMA6", "CH01", "A6:CH01"),  # PM prefix
+            ("A6", "CH1", "A6:CH01"),  # single-digit channel
+            ("C1", "CH12", "C1:CH12"),  # FTC detector
+            ("A6", "Ch01", "A6:CH01"),  # mixed case
+            ("PMC1", "CH12", "C1:CH12"),  # normalized-looking with PM prefix
+        ],
+    )
+    def test_normalize(self, pm, channel, expected):
+        """Test normalization of PM and channel names to PM:Channel keys."""
+        assert normalize_pm_channel(pm, channel) == expected
+
+    def test_normalize_returns_shared_string(self):
+        """Test that repeated keys share a single string object."""
+        assert normalize_pm_channel("A6", "CH01") is normalize_pm_channel("a6", "ch1")
 
 
-class TestNormalizePmChannel:
-    """Test cases for the normalize_pm_channel function."""
+class TestGridVisualizationService:
+    """Test cases for the GridVisualizationService class."""
 
-    def test_normalize_standard_format(self):
-        """Test normalization of standard PM:Channel format."""
-        result = normalize_pm_channel("A6", "CH01")
-        assert result == "A6:CH01"
+    def test_init_default_mappings(self, shared_service):
+        """Test that the default mappings are found, loaded and listed."""
+        service = shared_service
+        assert service.mappings_dir is not None
+        assert service.mappings_dir.exists()
+        assert len(service.mappings_cache) > 0
 
-    def test_normalize_lowercase(self):
-        """Test normalization with lowercase input."""
-        result = normalize_pm_channel("a6", "ch01")
-        assert result == "A6:CH01"
+        mappings = service.get_available_mappings()
+        assert len(mappings) == len(service.mappings_cache)
+        assert all(m.keys() == {"name", "channel_count", "file_path"} for m in mappings)
 
-    def test_normalize_with_pm_prefix(self):
-        """Test normalization with PM prefix."""
-        result = normalize_pm_channel("PMA6", "CH01")
-        assert result == "A6:CH01"
+    def test_init_custom_mappings(self, tmp_path):
+        """Test initialization with custom mappings directory."""
+        service = GridVisualizationService(mappings_dir=str(tmp_path))
+        assert service.mappings_dir == tmp_path
+
+    def test_load_custom_mapping_file(self, tmp_path):
+        """Test loading a mapping CSV with unnormalized keys and bad rows."""
+        (tmp_path / "custom.csv").write_text(
+            "PM:Channel,row,col\n"
+            "pma1:ch1,0,1.5\n"
+            "A1:CH2,1,x\n"
+            "\n"
+            "A2:ch3,2,0\n"
+        )
+        (tmp_path / "notes.txt").write_text("not a mapping")
 
-    def test_normalize_single_digit_channel(self):
-        """Test normalization of single-digit channel."""
-        result = normalize_pm_channel("A6", "CH1")
-        assert result == "A6:CH01"
+        service = GridVisualizationService(mappings_dir=str(tmp_path))
 
-    def test_normalize_ftc_detector(self):
-        """Test normalization for FTC detector."""
-        result = normalize_pm_channel("C1", "CH12")
-        assert result == "C1:CH12"
+        assert list(service.mappings_cache) == ["custom"]
+        mapping = service.get_mapping("custom")
+        assert mapping["mapping"] == {"A1:CH01": (0.0, 1.5), "A2:CH03": (2.0, 0.0)}
 
-    def test_normalize_mixed_case(self):
-        """Test normalization with mixed case."""
-        result = normalize_pm_channel("A6", "Ch01")
-        assert result == "A6:CH01"
+    def test_load_mapping_file_short_rows(self, tmp_path, caplog):
+        """Test that short rows are skipped when PM:Channel is not the first column."""
+        (tmp_path / "custom.csv").write_text(
+            "row,col,PM:Channel\n"
+            "0,1.5,A1:CH01\n"
+            "3\n"
+            "2,0,A2:CH03\n"
+        )
 
+        service = GridVisualizationService(mappings_dir=str(tmp_path))
 
-class TestGridVisualizationService:
-    """Test cases for the GridVisualizationService class."""
+        mapping = service.get_mapping("custom")
+        assert mapping["mapping"] == {"A1:CH01": (0.0, 1.5), "A2:CH03": (2.0, 0.0)}
+        assert "Skipping short row" in caplog.text
 
-    def test_init_default_mappings(self):
-        """Test initialization with default mappings directory."""
-        service = GridVisualizationService()
-        assert service.mappings_dir is not None
-        assert service.mappings_dir.exists()
+    def test_load_mappings_npz_cache(self, tmp_path, monkeypatch):
+        """Test that mappings are reloaded from the .npz sidecar."""
+        csv_path = tmp_path / "custom.csv"
+        csv_path.write_text("PM:Channel,row,col\nA1:CH01,0,1.5\nA2:CH03,2,0\n")
 
-    def test_init_custom_mappings(self):
-        """Test initialization with custom mappings directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            service = GridVisualizationService(mappings_dir=temp_dir)
-            assert service.mappings_dir == Path(temp_dir)
+        service = GridVisualizationService(mappings_dir=str(tmp_path), cache_mappings=True)
+        assert (tmp_path / "custom.npz").exists()
 
-    def test_load_mappings(self):
-        """Test that mappings are loaded successfully."""
-        service = GridVisualizationService()
-        assert len(service.mappings_cache) > 0
+        def fail(*args, **kwargs):
+            raise AssertionError("cached mapping was parsed again")
 
-    def test_get_available_mappings(self):
-        """Test getting list of available mappings."""
-        service = GridVisualizationService()
-        mappings = service.get_available_mappings()
+        with monkeypatch.context() as m:
+            m.setattr(csv, "reader", fail)
+            cached = GridVisualizationService(mappings_dir=str(tmp_path), cache_mappings=True)
 
-        assert len(mappings) > 0
-        assert all("name" in m for m in mappings)
-        assert all("channel_count" in m for m in mappings)
-        assert all("file_path" in m for m in mappings)
+        expected = service.get_mapping("custom")
+        mapping = cached.get_mapping("custom")
+        assert mapping["mapping"] == expected["mapping"]
+        assert mapping["keys"] == expected["keys"]
+        assert mapping["channel_count"] == expected["channel_count"]
 
-    def test_get_mapping_fta(self):
-        """Test getting FTA mapping."""
-        service = GridVisualizationService()
-        mapping = service.get_mapping("fta")
+        # An edited CSV is parsed again
+        csv_path.write_text("PM:Channel,row,col\nA1:CH01,0,1.5\n")
+        edited = GridVisualizationService(mappings_dir=str(tmp_path), cache_mappings=True)
+        assert edited.get_mapping("custom")["keys"] == ["A1:CH01"]
+
+    @pytest.mark.parametrize("name", ["fta", "ftc"])
+    def test_get_mapping(self, shared_service, name):
+        """Test getting the built-in FTA and FTC mappings."""
+        service = shared_service
+        mapping = service.get_mapping(name)
 
         assert mapping is not None
         assert "mapping" in mapping
         assert "channel_count" in mapping
         assert mapping["channel_count"] > 0
 
-    def test_get_mapping_ftc(self):
-        """Test getting FTC mapping."""
-        service = GridVisualizationService()
-        mapping = service.get_mapping("ftc")
+    def test_get_mapping_position_arrays(self, shared_service):
+        """Test that mappings carry key order and position arrays."""
+        service = shared_service
+        mapping = service.get_mapping("fta")
 
-        assert mapping is not None
-        assert "mapping" in mapping
-        assert "channel_count" in mapping
-        assert mapping["channel_count"] > 0
+        assert mapping["keys"] == list(mapping["mapping"])
+        assert len(mapping["rows"]) == len(mapping["cols"]) == len(mapping["mapping"])
+        key = mapping["keys"][-1]
+        assert (mapping["rows"][-1], mapping["cols"][-1]) == mapping["mapping"][key]
+        assert mapping["key_to_idx"][key] == len(mapping["keys"]) - 1
 
-    def test_get_mapping_nonexistent(self):
+    def test_get_mapping_nonexistent(self, shared_service):
         """Test getting non-existent mapping."""
-        service = GridVisualizationService()
+        service = shared_service
         mapping = service.get_mapping("nonexistent")
 
         assert mapping is None
 
-    def test_get_available_dates(self):
+    def test_get_available_dates(self, shared_service, example_data):
         """Test getting available dates from data."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(num_datasets=3)
+        service = shared_service
+        data = example_data(num_datasets=3)
 
-        dates = service.get_available_dates(data)
+        dates = service.summarize(data).dates
 
+        assert dates == service.get_available_dates(data)
         assert len(dates) == 3
-        assert all(isinstance(d, str) for d in dates)
+        assert {type(d) for d in dates} == {str}
         # Dates should be sorted
-        assert dates == sorted(dates)
+        assert all(earlier <= later for earlier, later in zip(dates, dates[1:]))
 
-    def test_extract_ageing_factors(self):
+    def test_extract_ageing_factors(self, shared_service, example_data):
         """Test extracting aging factors from data."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(
+        service = shared_service
+        data = example_data(
             detector_type="fta",
             num_datasets=2,
             modules_per_dataset=2,
@@ -155,18 +190,18 @@ class TestGridVisualizationService:
         )
 
         assert len(factors) > 0
-        assert all(isinstance(k, str) for k in factors.keys())
-        assert all(isinstance(v, float) for v in factors.values())
+        assert {type(k) for k in factors} == {str}
+        assert {type(v) for v in factors.values()} == {float}
         # Check that keys are in normalized format
         assert all(":" in k for k in factors.keys())
 
-    def test_extract_ageing_factors_specific_date(self):
+    def test_extract_ageing_factors_specific_date(self, shared_service, example_data):
         """Test extracting aging factors for specific date."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(num_datasets=2)
+        service = shared_service
+        data = example_data(num_datasets=2)
 
-        dates = service.get_available_dates(data)
-        selected_date = dates[0]
+        summary = service.summarize(data, "normalized_gauss_ageing_factor")
+        selected_date = summary.dates[0]
 
         factors = service._extract_ageing_factors(
             data,
@@ -175,11 +210,25 @@ class TestGridVisualizationService:
         )
 
         assert len(factors) > 0
+        assert factors == summary.factors[selected_date]
 
-    def test_create_grid_visualization(self):
+    def test_extract_all_ageing_factors(self, shared_service, example_data):
+        """Test that batch extraction matches per-date extraction."""
+        service = shared_service
+        data = example_data(num_datasets=3)
+
+        all_factors = service._extract_all_ageing_factors(data, "gaussian_ageing_factor")
+
+        assert list(all_factors) == service.get_available_dates(data)
+        for date, factors in all_factors.items():
+            assert factors == service._extract_ageing_factors(
+                data, selected_date=date, ageing_factor_type="gaussian_ageing_factor"
+            )
+
+    def test_create_grid_visualization(self, shared_service, example_data):
         """Test creating a grid visualization."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(detector_type="fta", num_datasets=1)
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=1)
 
         fig = service.create_grid_visualization(
             mapping_name="fta",
@@ -193,10 +242,38 @@ class TestGridVisualizationService:
         # Figure should have axes
         assert len(fig.axes) > 0
 
-    def test_create_grid_visualization_invalid_mapping(self):
+    def test_create_grid_visualization_single_collection(self, shared_service, example_data):
+        """Test that all cells are drawn as one collection."""
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=1)
+
+        fig = service.create_grid_visualization(mapping_name="fta", results_data=data)
+
+        ax = fig.axes[0]
+        assert len(ax.collections) == 1
+        assert len(ax.collections[0].get_paths()) == len(service.get_mapping("fta")["keys"])
+        assert not ax.patches
+
+    def test_update_grid_figure(self, shared_service):
+        """Test that a built figure can be updated with new values."""
+        service = shared_service
+        mapping = service.get_mapping("fta")
+        fig, state = service._build_grid_figure(mapping, "RdYlGn", 0.4, 1.2)
+        key = mapping["keys"][0]
+
+        service._update_grid_figure(state, {key: 0.5}, "first")
+        assert state.texts[0].get_text() == "0.50"
+        assert state.texts[1].get_text() == "1.00"
+
+        service._update_grid_figure(state, {key: 0.8}, "second")
+        assert state.texts[0].get_text() == "0.80"
+        assert state.texts[0].get_color() == "black"
+        assert state.ax.get_title() == "second"
+
+    def test_create_grid_visualization_invalid_mapping(self, shared_service, example_data):
         """Test creating visualization with invalid mapping."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data()
+        service = shared_service
+        data = example_data()
 
         fig = service.create_grid_visualization(
             mapping_name="nonexistent",
@@ -205,10 +282,10 @@ class TestGridVisualizationService:
 
         assert fig is None
 
-    def test_create_grid_visualization_with_date(self):
+    def test_create_grid_visualization_with_date(self, shared_service, example_data):
         """Test creating visualization for specific date."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=2)
 
         dates = service.get_available_dates(data)
         fig = service.create_grid_visualization(
@@ -219,50 +296,169 @@ class TestGridVisualizationService:
 
         assert fig is not None
 
-    def test_create_grid_gif(self):
-        """Test creating an animated GIF."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(detector_type="fta", num_datasets=3)
+    def test_create_grid_gif(self, shared_service, example_data):
+        """Test creating an animated GIF in memory."""
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=2)
 
-        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as f:
-            output_path = f.name
+        buf = io.BytesIO()
 
-        try:
-            success = service.create_grid_gif(
-                mapping_name="fta",
-                results_data=data,
-                output_path=output_path,
-                duration_ms=100,  # Faster for testing
-            )
+        success = service.create_grid_gif(
+            mapping_name="fta",
+            results_data=data,
+            output_path=buf,
+            duration_ms=100,  # Faster for testing
+            dpi=40,  # Two small frames are enough to check the output
+        )
+
+        assert success is True
+        assert buf.tell() > 0
+        assert buf.getvalue().startswith(b"GIF8")
+
+    @pytest.mark.parametrize("frames_per_task", [None, 1])
+    def test_create_grid_gif_workers(self, shared_service, tmp_path, frames_per_task, example_data):
+        """Test rendering GIF frames in worker processes."""
+        from PIL import Image
+
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=3)
+        output_path = tmp_path / "grid.gif"
+
+        success = service.create_grid_gif(
+            mapping_name="fta",
+            results_data=data,
+            output_path=str(output_path),
+            duration_ms=100,
+            workers=2,
+            frames_per_task=frames_per_task,
+        )
+
+        assert success is True
+        with Image.open(output_path) as img:
+            assert img.n_frames == 3
+
+    @pytest.mark.parametrize(
+        "workers, cpu_count, pool_sizes",
+        [
+            (None, 1, []),  # one CPU: render in this process
+            (8, 1, [3]),  # no more processes than tasks
+            (2, 1, [2]),
+        ],
+    )
+    def test_create_grid_gif_pool_size(
+        self, shared_service, monkeypatch, example_data, workers, cpu_count, pool_sizes
+    ):
+        """Test that the worker pool is only created, and sized, for the tasks at hand."""
+        created = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def __init__(self, max_workers=None, **kwargs):
+                created.append(max_workers)
+                super().__init__(max_workers=max_workers, **kwargs)
+
+        monkeypatch.setattr(grid_visualization_service, "ProcessPoolExecutor", RecordingPool)
+        monkeypatch.setattr(grid_visualization_service.os, "cpu_count", lambda: cpu_count)
+
+        assert shared_service.create_grid_gif(
+            mapping_name="fta",
+            results_data=example_data(detector_type="fta", num_datasets=3),
+            output_path=io.BytesIO(),
+            workers=workers,
+            dpi=40,
+        )
+        assert created == pool_sizes
+
+    def test_create_grid_gif_max_width(self, shared_service, tmp_path, example_data):
+        """Test that frames are rendered at a lower resolution to fit max_width."""
+        from PIL import Image
 
-            assert success is True
-            assert Path(output_path).exists()
-            assert Path(output_path).stat().st_size > 0
-        finally:
-            # Clean up
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=2)
+        output_path = tmp_path / "grid.gif"
 
-    def test_create_grid_gif_invalid_mapping(self):
+        assert service.create_grid_gif(
+            mapping_name="fta", results_data=data, output_path=str(output_path), max_width=600
+        )
+
+        # The 12 x 10 inch figure is rendered at 50 dpi instead of 100
+        with Image.open(output_path) as img:
+            assert img.size == (600, 500)
+
+    def test_create_grid_gif_shared_palette(self, shared_service, tmp_path):
+        """Test that colors first seen in later frames keep their exact value."""
+        import numpy as np
+        from PIL import Image
+
+        service = shared_service
+        data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+        for dataset, value in zip(data["datasets"], (1.2, 0.4)):
+            for module in dataset["modules"]:
+                for channel in module["channels"]:
+                    channel["ageing_factors"]["normalized_gauss_ageing_factor"] = value
+        output_path = tmp_path / "grid.gif"
+
+        assert service.create_grid_gif(
+            mapping_name="fta", results_data=data, output_path=str(output_path)
+        )
+
+        # The second frame's cells are all at vmin, i.e. the first RdYlGn color
+        with Image.open(output_path) as img:
+            img.seek(1)
+            rgb = np.asarray(img.convert("RGB")).reshape(-1, 3).astype(int)
+        assert np.abs(rgb - [165, 0, 38]).sum(axis=1).min() == 0
+
+    def test_create_grid_gif_unknown_colormap(self, shared_service, tmp_path, example_data):
+        """Test that an unknown colormap fails before any frame is rendered."""
+        service = shared_service
+        data = example_data(detector_type="fta", num_datasets=2)
+
+        success = service.create_grid_gif(
+            mapping_name="fta",
+            results_data=data,
+            output_path=str(tmp_path / "grid.gif"),
+            colormap="not_a_colormap",
+        )
+
+        assert success is False
+        assert not (tmp_path / "grid.gif").exists()
+
+    def test_create_grid_gif_invalid_mapping(self, shared_service, tmp_path, example_data):
         """Test creating GIF with invalid mapping."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data()
+        service = shared_service
+        data = example_data()
 
-        with tempfile.NamedTemporaryFile(suffix=".gif", delete=False) as f:
-            output_path = f.name
+        output_path = tmp_path / "grid.gif"
 
-        try:
-            success = service.create_grid_gif(
-                mapping_name="nonexistent",
-                results_data=data,
-                output_path=output_path,
-            )
+        success = service.create_grid_gif(
+            mapping_name="nonexistent",
+            results_data=data,
+            output_path=str(output_path),
+        )
+
+        assert success is False
+        assert not output_path.exists()
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"workers": -1},
+            {"workers": 2, "frames_per_task": 0},
+            {"frames_per_task": -1},
+            {"dpi": 0},
+            {"dpi": -40},
+            {"max_width": 0},
+        ],
+    )
+    def test_create_grid_gif_invalid_options(self, shared_service, example_data, options):
+        """Test that out-of-range rendering options are rejected before rendering."""
+        buf = io.BytesIO()
+
+        success = shared_service.create_grid_gif(
+            mapping_name="fta", results_data=example_data(), output_path=buf, **options
+        )
 
-            assert success is False
-        finally:
-            # Clean up
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        assert success is False
+        assert buf.tell() == 0
 
     def test_refresh_mappings(self):
         """Test refreshing the mappings cache."""
@@ -274,10 +470,10 @@ class TestGridVisualizationService:
         # Should have the same number of mappings after refresh
         assert len(service.mappings_cache) == initial_count
 
-    def test_extract_available_parameters(self):
+    def test_extract_available_parameters(self, shared_service, example_data):
         """Test extracting available parameters from data."""
-        service = GridVisualizationService()
-        data = DataLoader.create_example_data(
+        service = shared_service
+        data = example_data(
             detector_type="fta",
             num_datasets=2,
             modules_per_dataset=2,
@@ -287,14 +483,14 @@ class TestGridVisualizationService:
         parameters = service.extract_available_parameters(data)
 
         assert len(parameters) > 0
-        assert all(isinstance(p, str) for p in parameters)
+        assert {type(p) for p in parameters} == {str}
         # Should contain expected parameters
         assert "normalized_gauss_ageing_factor" in parameters
         assert "normalized_weighted_ageing_factor" in parameters
 
-    def test_extract_available_parameters_custom_parameter(self):
+    def test_extract_available_parameters_custom_parameter(self, shared_service):
         """Test extracting custom parameter from data."""
-        service = GridVisualizationService()
+        service = shared_service
         # Create custom data with a custom parameter
         custom_data = DataLoader.create_example_data()
         # Add a custom parameter to the first channel
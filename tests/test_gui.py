@@ -2,121 +2,287 @@
 Tests for the GUI module.
 """
 
+import os
+import sys
 import tkinter as tk
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from detectormappingvisualizer.data_loader import DataLoader
 
+# Tk needs an X display except on macOS and Windows; deciding this at
+# collection time avoids a failing Tk() call for every test
+requires_display = pytest.mark.skipif(
+    sys.platform not in ("darwin", "win32") and not os.environ.get("DISPLAY"),
+    reason="Display not available for GUI testing",
+)
 
+
+@pytest.fixture(scope="class")
+def _class_tk_root():
+    """One Tk root per test class; creating and destroying it is slow."""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        pytest.skip(f"Display not available for GUI testing: {e}")
+    yield root
+    root.destroy()
+
+
+@pytest.fixture
+def tk_root(_class_tk_root):
+    """The class's Tk root, cleared of the previous test's callbacks and widgets."""
+    root = _class_tk_root
+    yield root
+    for after_id in root.tk.splitlist(root.tk.call("after", "info")):
+        root.after_cancel(after_id)
+    for child in root.winfo_children():
+        child.destroy()
+
+
+@requires_display
+@pytest.mark.xdist_group(name="gui")
 class TestGUI:
-    """Test cases for the GUI module."""
+    """Test cases for the GUI window."""
 
-    def test_gui_import(self):
-        """Test that GUI module can be imported."""
+    def test_gui_initialization(self, tk_root):
+        """Test GUI initialization without mainloop."""
         try:
-            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI, launch_gui
-            assert DetectorMappingVisualizerGUI is not None
-            assert launch_gui is not None
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
         except ImportError as e:
             pytest.skip(f"GUI module not available: {e}")
 
-    def test_gui_initialization(self):
-        """Test GUI initialization without mainloop."""
+        app = DetectorMappingVisualizerGUI(tk_root)
+
+        # Check that main components exist
+        assert app.root is not None
+        assert app.service is not None
+        assert app.fta_figure is not None
+        assert app.ftc_figure is not None
+        assert app.fta_canvas is not None
+        assert app.ftc_canvas is not None
+
+    def test_gui_data_loading_mock(self, tk_root):
+        """Test GUI data loading with mock data."""
         try:
             from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
-            
-            root = tk.Tk()
-            try:
-                app = DetectorMappingVisualizerGUI(root)
-                
-                # Check that main components exist
-                assert app.root is not None
-                assert app.service is not None
-                assert app.fta_figure is not None
-                assert app.ftc_figure is not None
-                assert app.fta_canvas is not None
-                assert app.ftc_canvas is not None
-                
-            finally:
-                root.destroy()
-                
         except ImportError as e:
             pytest.skip(f"GUI module not available: {e}")
-        except tk.TclError as e:
-            pytest.skip(f"Display not available for GUI testing: {e}")
 
-    def test_gui_data_loading_mock(self):
-        """Test GUI data loading with mock data."""
+        app = DetectorMappingVisualizerGUI(tk_root)
+
+        # Create mock data
+        mock_data = DataLoader.create_example_data(
+            detector_type="fta",
+            num_datasets=2
+        )
+
+        # Simulate loading data
+        app.data = mock_data
+        app.current_file = "test.json"
+
+        # Check that data was loaded
+        assert app.data is not None
+        assert len(app.data["datasets"]) == 2
+
+    def test_gui_settings_variables(self, tk_root):
+        """Test that GUI settings variables are initialized correctly."""
         try:
             from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
-            
-            root = tk.Tk()
-            try:
-                app = DetectorMappingVisualizerGUI(root)
-                
-                # Create mock data
-                mock_data = DataLoader.create_example_data(
-                    detector_type="fta",
-                    num_datasets=2
-                )
-                
-                # Simulate loading data
-                app.data = mock_data
-                app.current_file = "test.json"
-                
-                # Check that data was loaded
-                assert app.data is not None
-                assert len(app.data["datasets"]) == 2
-                
-            finally:
-                root.destroy()
-                
         except ImportError as e:
             pytest.skip(f"GUI module not available: {e}")
-        except tk.TclError as e:
-            pytest.skip(f"Display not available for GUI testing: {e}")
 
-    def test_gui_settings_variables(self):
-        """Test that GUI settings variables are initialized correctly."""
+        app = DetectorMappingVisualizerGUI(tk_root)
+
+        # Check default values
+        assert app.selected_date.get() == "Latest"
+        assert app.factor_type.get() == "normalized_gauss_ageing_factor"
+        assert app.colormap.get() == "custom"  # Default is now custom colormap
+        assert app.vmin.get() == 0.4
+        assert app.vmax.get() == 1.2
+        # Check that custom colormap colors are initialized
+        assert len(app.custom_colormap_colors) == 15
+        assert app.custom_colormap_colors[0] == "#000000"
+
+    def test_unchanged_settings_skip_redraw(self, tk_root):
+        """Test that refreshing with unchanged settings does not redraw."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        app = DetectorMappingVisualizerGUI(tk_root)
+        app.data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+
+        with patch.object(app, "_draw_visualization", return_value=None) as draw:
+            app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+            app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+            assert draw.call_count == 1
+
+            app.factor_type.set("gauss_ageing_factor")
+            app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+            assert draw.call_count == 2
+
+    def test_range_change_recolors_without_rebuild(self, tk_root):
+        """Test that changing vmin/vmax updates the existing cell collection."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        app = DetectorMappingVisualizerGUI(tk_root)
+        app.data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+
+        app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+        cells = app._plot_states["fta"]["cells"]
+        assert cells is not None
+
+        app.vmax.set(1.5)
+        app.colormap.set("viridis")
+        with patch.object(app, "_draw_visualization") as draw:
+            app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+            draw.assert_not_called()
+
+        assert app._plot_states["fta"]["cells"] is cells
+        assert cells.norm.vmax == 1.5
+        assert cells.cmap.name == "viridis"
+
+    def test_range_change_blits_over_saved_background(self, tk_root):
+        """Test that recoloring after a full draw blits instead of redrawing."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        app = DetectorMappingVisualizerGUI(tk_root)
+        app.data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+
+        app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+        app.fta_canvas.draw()
+        assert app._plot_states["fta"]["background"] is not None
+
+        app.vmax.set(1.5)
+        with patch.object(app.fta_canvas, "draw_idle") as draw_idle, \
+                patch.object(app.fta_canvas, "blit") as blit:
+            app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+            draw_idle.assert_not_called()
+            blit.assert_called_once()
+
+    def test_date_change_reuses_cell_collection(self, tk_root):
+        """Test that a new date updates the existing cells instead of rebuilding."""
         try:
             from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
-            
-            root = tk.Tk()
-            try:
-                app = DetectorMappingVisualizerGUI(root)
-                
-                # Check default values
-                assert app.selected_date.get() == "Latest"
-                assert app.factor_type.get() == "normalized_gauss_ageing_factor"
-                assert app.colormap.get() == "custom"  # Default is now custom colormap
-                assert app.vmin.get() == 0.4
-                assert app.vmax.get() == 1.2
-                # Check that custom colormap colors are initialized
-                assert len(app.custom_colormap_colors) == 15
-                assert app.custom_colormap_colors[0] == "#000000"
-                
-            finally:
-                root.destroy()
-                
         except ImportError as e:
             pytest.skip(f"GUI module not available: {e}")
-        except tk.TclError as e:
-            pytest.skip(f"Display not available for GUI testing: {e}")
 
-    def test_launch_gui_mock(self):
+        app = DetectorMappingVisualizerGUI(tk_root)
+        app.data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+        first_date = app.data["datasets"][0]["date"]
+
+        app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+        cells = app._plot_states["fta"]["cells"]
+
+        app._update_visualization("fta", app.fta_figure, app.fta_canvas, first_date)
+        state = app._plot_states["fta"]
+        assert state["cells"] is cells
+        assert state["ax"].get_title().endswith(first_date)
+        assert len(app.fta_figure.axes) == 2
+
+    def test_show_values_toggle(self, tk_root):
+        """Test that cell value labels can be turned off."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        app = DetectorMappingVisualizerGUI(tk_root)
+        app.data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+
+        app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+        assert app._plot_states["fta"]["texts"]
+
+        app.show_values.set(False)
+        app._update_visualization("fta", app.fta_figure, app.fta_canvas, None)
+        assert app._plot_states["fta"]["texts"] == []
+
+    def test_missing_mapping_placeholder_drawn_once(self, tk_root):
+        """Test that the 'no mapping' message is not redrawn for every date."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        app = DetectorMappingVisualizerGUI(tk_root)
+        app.data = DataLoader.create_example_data(detector_type="fta", num_datasets=2)
+
+        with patch.object(app.service, "get_mapping", return_value=None), \
+                patch.object(app.ftc_canvas, "draw_idle") as draw_idle:
+            for date in (None, "2024-01-01", "2024-02-01"):
+                app._update_visualization("ftc", app.ftc_figure, app.ftc_canvas, date)
+            assert draw_idle.call_count == 1
+
+    def test_scheduled_refreshes_are_coalesced(self, tk_root):
+        """Test that a burst of scheduled refreshes runs only once."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        app = DetectorMappingVisualizerGUI(tk_root)
+
+        with patch.object(app, "refresh_visualizations") as refresh:
+            for _ in range(3):
+                app._schedule_refresh()
+            tk_root.after(app._REFRESH_DELAY_MS * 2)
+            tk_root.update()
+            assert refresh.call_count == 1
+
+    def test_launch_gui_mock(self, shared_service):
         """Test launch_gui function with mocked mainloop."""
         try:
             from detectormappingvisualizer.gui import launch_gui
-            
-            # Mock the mainloop to prevent it from blocking
-            with patch("tkinter.Tk.mainloop"):
-                # This should create the GUI without entering mainloop
-                launch_gui()
-                
         except ImportError as e:
             pytest.skip(f"GUI module not available: {e}")
-        except tk.TclError as e:
-            pytest.skip(f"Display not available for GUI testing: {e}")
 
+        # Mock the mainloop to prevent it from blocking
+        with patch("tkinter.Tk.mainloop"):
+            # This should create the GUI without entering mainloop
+            launch_gui(service=shared_service)
+
+
+class TestGUIHelpers:
+    """Test cases for the GUI module that need no display."""
+
+    def test_gui_import(self):
+        """Test that GUI module can be imported."""
+        try:
+            from detectormappingvisualizer.gui import DetectorMappingVisualizerGUI, launch_gui
+            assert DetectorMappingVisualizerGUI is not None
+            assert launch_gui is not None
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+    def test_cell_values(self):
+        """Test cell value lookup with a default for missing channels."""
+        try:
+            from detectormappingvisualizer.gui import _cell_values
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        values = _cell_values(["A1:CH01", "A1:CH02", "A1:CH03"], {"A1:CH02": 0.5, "C1:CH01": 0.7})
+
+        assert values.tolist() == [1.0, 0.5, 1.0]
+
+    def test_write_example_data(self, tmp_path):
+        """Test the example data writer used by the background generator."""
+        try:
+            from detectormappingvisualizer.gui import _write_example_data
+        except ImportError as e:
+            pytest.skip(f"GUI module not available: {e}")
+
+        file_path = tmp_path / "example.json"
+        data = _write_example_data(str(file_path), "ftc")
+
+        assert DataLoader.load_from_file(file_path) == data
+        assert data["datasets"][0]["modules"][0]["identifier"].startswith("C")
@@ -3,16 +3,17 @@ Tests for the main module.
 """
 
 import json
+import subprocess
 import sys
-import tempfile
-from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
 from detectormappingvisualizer.data_loader import DataLoader
 from detectormappingvisualizer.main import (
+    _get_service,
     create_parser,
+    create_visualization,
     generate_example_data,
     validate_input_data,
 )
@@ -32,96 +33,81 @@ class TestCreateParser:
         help_text = parser.format_help()
         assert "Detector Mapping Visualizer" in help_text
 
+    def test_parser_gif_workers(self):
+        """Test that GIF frames are rendered in this process by default."""
+        parser = create_parser()
+        assert parser.parse_args([]).gif_workers == 1
+        assert parser.parse_args(["--gif-workers", "4"]).gif_workers == 4
+        assert parser.parse_args(["--gif-workers", "0"]).gif_workers == 0
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["--gif-workers", "-1"],
+            ["--frames-per-worker", "0"],
+            ["--frames-per-worker", "-2"],
+            ["--gif-dpi", "0"],
+            ["--gif-dpi", "-50"],
+            ["--gif-dpi", "nan"],
+            ["--gif-max-width", "0"],
+        ],
+    )
+    def test_parser_rejects_out_of_range_gif_options(self, argv, capsys):
+        """Test that out-of-range GIF options are reported as usage errors."""
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(argv)
+        assert "must be >" in capsys.readouterr().err
+
 
 class TestGenerateExampleData:
     """Test cases for example data generation."""
 
-    def test_generate_example_data_fta(self):
-        """Test generating example data for FTA detector."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            output_path = f.name
-
-        try:
-            generate_example_data(output_path, "fta")
-            assert Path(output_path).exists()
-
-            # Load and validate the generated data
-            with open(output_path, "r") as f:
-                data = json.load(f)
-
-            assert "datasets" in data
-            # Check module identifiers start with 'A'
-            for dataset in data["datasets"]:
-                for module in dataset["modules"]:
-                    assert module["identifier"].startswith("A")
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
-
-    def test_generate_example_data_ftc(self):
-        """Test generating example data for FTC detector."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            output_path = f.name
-
-        try:
-            generate_example_data(output_path, "ftc")
-            assert Path(output_path).exists()
-
-            # Load and validate the generated data
-            with open(output_path, "r") as f:
-                data = json.load(f)
-
-            assert "datasets" in data
-            # Check module identifiers start with 'C'
-            for dataset in data["datasets"]:
-                for module in dataset["modules"]:
-                    assert module["identifier"].startswith("C")
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+    @pytest.mark.parametrize("detector, prefix", [("fta", "A"), ("ftc", "C")])
+    def test_generate_example_data(self, tmp_path, detector, prefix):
+        """Test generating example data for the FTA and FTC detectors."""
+        output_path = tmp_path / "example.json"
+
+        generate_example_data(str(output_path), detector)
+        assert output_path.exists()
+
+        # Load and validate the generated data
+        data = json.loads(output_path.read_text())
+
+        assert "datasets" in data
+        # Module identifiers start with the detector's letter
+        identifiers = [
+            module["identifier"]
+            for dataset in data["datasets"]
+            for module in dataset["modules"]
+        ]
+        assert identifiers
+        assert all(identifier.startswith(prefix) for identifier in identifiers)
 
 
 class TestValidateInputData:
     """Test cases for input data validation."""
 
-    def test_validate_valid_data(self):
+    def test_validate_valid_data(self, example_json_path):
         """Test validation of valid data file."""
-        data = DataLoader.create_example_data()
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            json.dump(data, f)
-            temp_path = f.name
+        loaded_data = validate_input_data(example_json_path, show_summary=False)
+        assert loaded_data is not None
+        assert "datasets" in loaded_data
 
-        try:
-            loaded_data = validate_input_data(temp_path, show_summary=False)
-            assert loaded_data is not None
-            assert "datasets" in loaded_data
-        finally:
-            Path(temp_path).unlink()
-
-    def test_validate_with_summary(self, capsys):
+    def test_validate_with_summary(self, capsys, example_json_path):
         """Test validation with summary output."""
-        data = DataLoader.create_example_data()
+        validate_input_data(example_json_path, show_summary=True)
+        lines = capsys.readouterr().out.splitlines()
+        assert "Data Summary:" in lines
+        assert "  Total datasets: 3" in lines
 
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            json.dump(data, f)
-            temp_path = f.name
+    def test_validate_stream_with_summary(self, capsys, example_json_path):
+        """Test streaming validation prints the summary and keeps no data."""
+        pytest.importorskip("ijson")
 
-        try:
-            validate_input_data(temp_path, show_summary=True)
-            captured = capsys.readouterr()
-            assert "Data Summary" in captured.out
-            assert "Total datasets" in captured.out
-        finally:
-            Path(temp_path).unlink()
+        assert validate_input_data(example_json_path, show_summary=True, stream=True) is None
+        lines = capsys.readouterr().out.splitlines()
+        assert "Data Summary:" in lines
+        assert "  Total datasets: 3" in lines
 
     def test_validate_nonexistent_file(self):
         """Test validation fails for non-existent file."""
@@ -129,6 +115,46 @@ class TestValidateInputData:
             validate_input_data("nonexistent_file.json")
 
 
+class TestCreateVisualization:
+    """Test cases for saving visualizations."""
+
+    def test_png_matches_tight_savefig(self, tmp_path):
+        """Test that PNG output has the size of a tight savefig."""
+        from PIL import Image
+
+        from detectormappingvisualizer.grid_visualization_service import (
+            GridVisualizationService,
+        )
+
+        data = DataLoader.create_example_data()
+        output_path = tmp_path / "grid.png"
+        create_visualization(data, str(output_path), "fta")
+
+        fig = GridVisualizationService().create_grid_visualization(
+            mapping_name="fta", results_data=data
+        )
+        fig.savefig(tmp_path / "reference.png", dpi=300, bbox_inches="tight", facecolor="white")
+
+        with Image.open(output_path) as img, Image.open(tmp_path / "reference.png") as ref:
+            assert img.mode == "RGB"
+            assert abs(img.width - ref.width) <= 2
+            assert abs(img.height - ref.height) <= 2
+            # The corner is background, which must be white
+            assert img.getpixel((0, 0)) == (255, 255, 255)
+
+    def test_service_is_shared(self):
+        """Test that the service is created once per mappings directory."""
+        assert _get_service(None) is _get_service(None)
+
+    @pytest.mark.parametrize("suffix", [".jpg", ".svg"])
+    def test_other_formats(self, tmp_path, suffix):
+        """Test saving JPEG (written with Pillow) and SVG (written by savefig)."""
+        output_path = tmp_path / f"grid{suffix}"
+        create_visualization(DataLoader.create_example_data(), str(output_path), "fta")
+
+        assert output_path.stat().st_size > 0
+
+
 class TestMainIntegration:
     """Integration tests for the main function."""
 
@@ -138,58 +164,58 @@ class TestMainIntegration:
             from detectormappingvisualizer.main import main
 
             main()
-            captured = capsys.readouterr()
-            assert "Available Detector Mappings" in captured.out
+            lines = capsys.readouterr().out.splitlines()
+            assert "Available Detector Mappings:" in lines
+            assert "  • fta" in lines
 
-    def test_main_generate_example(self):
+    def test_main_generate_example(self, tmp_path):
         """Test main with --generate-example option."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            output_path = f.name
-
-        try:
-            with patch.object(
-                sys,
-                "argv",
-                [
-                    "detectormappingvisualizer",
-                    "--generate-example",
-                    "-o",
-                    output_path,
-                    "--detector",
-                    "fta",
-                ],
-            ):
-                from detectormappingvisualizer.main import main
-
-                main()
-                assert Path(output_path).exists()
-        finally:
-            if Path(output_path).exists():
-                Path(output_path).unlink()
+        output_path = tmp_path / "example.json"
+
+        with patch.object(
+            sys,
+            "argv",
+            [
+                "detectormappingvisualizer",
+                "--generate-example",
+                "-o",
+                str(output_path),
+                "--detector",
+                "fta",
+            ],
+        ):
+            from detectormappingvisualizer.main import main
 
-    def test_main_validate_only(self):
+            main()
+            assert output_path.exists()
+
+    def test_main_generate_example_skips_matplotlib(self, tmp_path):
+        """Test that commands which don't plot never import matplotlib."""
+        output_path = tmp_path / "example.json"
+        argv = ["detectormappingvisualizer", "--generate-example", "-o", str(output_path)]
+        code = (
+            "import sys\n"
+            "from detectormappingvisualizer.main import main\n"
+            f"sys.argv = {argv!r}\n"
+            "main()\n"
+            "assert 'matplotlib' not in sys.modules, 'matplotlib was imported'\n"
+        )
+
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+        assert output_path.exists()
+
+    def test_main_validate_only(self, example_json_path):
         """Test main with --validate option."""
-        data = DataLoader.create_example_data()
-
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False
-        ) as f:
-            json.dump(data, f)
-            input_path = f.name
-
-        try:
-            with patch.object(
-                sys,
-                "argv",
-                ["detectormappingvisualizer", "-i", input_path, "--validate"],
-            ):
-                from detectormappingvisualizer.main import main
+        with patch.object(
+            sys,
+            "argv",
+            ["detectormappingvisualizer", "-i", example_json_path, "--validate"],
+        ):
+            from detectormappingvisualizer.main import main
 
-                main()  # Should not raise an exception
-        finally:
-            Path(input_path).unlink()
+            main()  # Should not raise an exception
 
     def test_main_no_args(self):
         """Test main with no arguments launches GUI."""